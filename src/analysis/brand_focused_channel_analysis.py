@@ -6,33 +6,44 @@ including deep personality analysis, content authenticity, and sponsored content
 """
 
 import os
-import json
+import re
 import logging
+import threading
 import time
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime, timezone, timedelta
 from collections import Counter, defaultdict
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
 
+import httplib2
+import numpy as np
 import pandas as pd
+from google_auth_httplib2 import AuthorizedHttp
+
+try:
+    import ahocorasick
+except ImportError:  # optional: fall back to a compiled regex scan
+    ahocorasick = None
 
 from src.youtube.oauth import get_service as get_oauth_service
+from src.youtube.analytics import _get_analytics_service
 from src.youtube.public import get_service as get_public_service, extract_channel_id_from_url
 from src.analysis.video_frames import (
     extract_video_id,
     download_video,
-    extract_frames,
+    extract_frame_images,
     get_video_duration_from_url,
     auto_select_video_quality,
 )
-from src.analysis.audio import extract_audio, transcribe as transcribe_audio
+from src.analysis.audio import load_audio, transcribe as transcribe_audio
 from src.analysis.video_vision import summarise_frames
-from src.llms import get_smart_client
+from src.llms import cached_chat
 from src.config.settings import SETTINGS
 from src.auth.manager import list_token_files as _list_token_files
+from src.helpers.json_io import read_json as _read_json, write_json
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +57,24 @@ TOKENS_DIR.mkdir(exist_ok=True, parents=True)
 
 DEFAULT_CLIENT_SECRET = ROOT / "client_secret.json"
 
+# OAuth capability probes keyed by token path and validated against the
+# token's mtime, persisted so restarts don't re-probe unchanged tokens.
+OAUTH_PROBE_CACHE_FILE = ROOT / "data" / "cache" / "oauth_probe.json"
+_OAUTH_PROBE_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# Below this much transcript + visual analysis there is nothing for the LLM
+# to assess and the neutral profile is returned directly.
+MIN_CREATOR_ANALYSIS_CHARS = 200
+
+# Categorisation and the creator prompts only look at the start of the
+# transcript, so no more than this is ever joined from the segments.
+TRANSCRIPT_CONTEXT_CHARS = 3000
+
+# Likewise, fewer comments or less comment text than this gives the comments
+# analysis too little signal to be worth an LLM call.
+MIN_COMMENTS_FOR_ANALYSIS = 3
+MIN_COMMENT_ANALYSIS_CHARS = 200
+
 # Comprehensive content categories for brand analysis (Enhanced & More Accurate)
 CONTENT_CATEGORIES = {
     # Technology & Programming (Enhanced)
@@ -101,8 +130,197 @@ CONTENT_CATEGORIES = {
     "Real Estate & Property": ["real estate", "property", "house", "home", "investment property", "market"],
 }
 
+# Flat keyword tables built once at import: one entry per (category, keyword)
+# pair, with the owning category stored as an index into _CATEGORY_NAMES.
+_CATEGORY_NAMES: Tuple[str, ...] = tuple(CONTENT_CATEGORIES)
+_KEYWORDS: Tuple[str, ...] = tuple(k for kws in CONTENT_CATEGORIES.values() for k in kws)
+_KEYWORD_CATEGORY = np.fromiter(
+    (ci for ci, kws in enumerate(CONTENT_CATEGORIES.values()) for _ in kws), dtype=np.int32
+)
+
+_KEYWORDS_LOWER: Tuple[str, ...] = tuple(k.lower() for k in _KEYWORDS)
+
+# Distinct lower-cased keywords ("terms"). Some keywords ("game", "team",
+# "streaming", ...) are listed under several categories and share a term id.
+_TERMS: Tuple[str, ...] = tuple(dict.fromkeys(_KEYWORDS_LOWER))
+_TERM_IDS: Dict[str, int] = {term: i for i, term in enumerate(_TERMS)}
+_KEYWORD_TERM = np.fromiter((_TERM_IDS[k] for k in _KEYWORDS_LOWER), dtype=np.intp, count=len(_KEYWORDS))
+# Spelling as listed in CONTENT_CATEGORIES, used for subcategory names
+_TERM_LABELS: Tuple[str, ...] = tuple(_KEYWORDS[_KEYWORDS_LOWER.index(term)] for term in _TERMS)
+
+# Generic keywords that don't add value as subcategories
+_GENERIC_SUBCATEGORY_WORDS = {"brand partnership", "partnership", "brand", "content", "video", "youtube", "analysis", "review"}
+_SUBCATEGORY_CANDIDATE = np.array(
+    [term not in _GENERIC_SUBCATEGORY_WORDS and len(term) > 2 for term in _TERMS], dtype=bool
+)
+
+def _build_keyword_automaton():
+    """Compile every category keyword into one Aho-Corasick automaton."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term_id, term in enumerate(_TERMS):
+        automaton.add_word(term, term_id)
+    automaton.make_automaton()
+    return automaton
+
+
+def _keyword_trie_pattern(keywords) -> str:
+    """Regex alternation matching *keywords*, factored by common prefix."""
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def _build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + _build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        terminal = "" in node
+        body = branches[0] if len(branches) == 1 and not terminal else f"(?:{'|'.join(branches)})"
+        return body + "?" if terminal else body
+
+    return _build(trie)
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Without pyahocorasick: a zero-width lookahead tries the keyword trie at
+# every offset and reports the longest keyword starting there; the shorter
+# keywords that are prefixes of it are credited via _TERM_PREFIXES.
+_KEYWORD_PATTERN = (
+    re.compile(f"(?=({_keyword_trie_pattern(_TERMS)}))") if _KEYWORD_AUTOMATON is None else None
+)
+_TERM_PREFIXES: Dict[str, List[int]] = {
+    term: [i for i, other in enumerate(_TERMS) if term.startswith(other)] for term in _TERMS
+}
+
+
+def _keyword_hits(text: str) -> np.ndarray:
+    """Term id of every category keyword occurrence in lower-cased *text*.
+
+    Either way this is a single C-level pass over the text rather than one
+    scan per keyword.
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        return np.fromiter((term_id for _, term_id in _KEYWORD_AUTOMATON.iter(text)), dtype=np.intp)
+    return np.fromiter(
+        (term_id for longest in _KEYWORD_PATTERN.findall(text) for term_id in _TERM_PREFIXES[longest]),
+        dtype=np.intp,
+    )
+
+def _thread_http(service: object) -> object:
+    """Return a private HTTP transport for calls on *service* from a worker thread.
+
+    httplib2 connections are not thread-safe, so concurrent requests must not
+    share the transport the service was built with.
+    """
+    credentials = getattr(service._http, "credentials", None)  # type: ignore[attr-defined]
+    if credentials is None:
+        return httplib2.Http()
+    return AuthorizedHttp(credentials, http=httplib2.Http())
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the module's dataclasses for the stdlib ``json`` fallback."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write *data* as indented UTF-8 JSON, using orjson when available.
+    
+    Dataclasses may be passed as-is: orjson encodes them natively and the
+    stdlib fallback goes through their ``to_dict``.
+    """
+    write_json(path, data, default=_json_default)
+
+
+def _load_oauth_probe_cache() -> None:
+    """Populate the in-memory OAuth probe cache from disk once per process."""
+    if _OAUTH_PROBE_CACHE or not OAUTH_PROBE_CACHE_FILE.exists():
+        return
+    try:
+        _OAUTH_PROBE_CACHE.update(_read_json(OAUTH_PROBE_CACHE_FILE))
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable OAuth probe cache: {e}")
+
+
+def _save_oauth_probe_cache() -> None:
+    try:
+        OAUTH_PROBE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _write_json(OAUTH_PROBE_CACHE_FILE, _OAUTH_PROBE_CACHE)
+    except Exception as e:
+        logger.warning(f"Failed to save OAuth probe cache: {e}")
 
-@dataclass
+
+def _read_duration_meta(path: Path) -> Optional[int]:
+    """Return the duration_minutes stored in a video's ``.meta`` sidecar, if any."""
+    try:
+        with path.open(encoding="utf-8") as f:
+            return int(f.readline())
+    except (OSError, ValueError):
+        return None
+
+
+def _read_checkpoint(path: Path) -> Optional[str]:
+    """Return the text saved by an earlier, interrupted run, if any."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _transcript_prefix(segments: List[Dict[str, Any]], limit: int = TRANSCRIPT_CONTEXT_CHARS) -> str:
+    """Join segment texts with newlines, stopping once *limit* characters are covered."""
+    parts: List[str] = []
+    total = 0
+    for segment in segments:
+        text = segment.get("text", "")
+        parts.append(text)
+        total += len(text) + 1
+        if total >= limit:
+            break
+    return "\n".join(parts)[:limit]
+
+
+def _truncate(text: str, limit: int) -> str:
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _with_engagement_rate(videos: pd.DataFrame) -> pd.DataFrame:
+    """Add ``engagement_rate`` ((likes + comments) / views, in %) to *videos*."""
+    views = videos["view_count"].where(videos["view_count"] > 0)
+    rate = (videos["like_count"] + videos["comment_count"]) / views * 100
+    return videos.assign(engagement_rate=rate.fillna(0.0))
+
+
+def _empty_videos_frame() -> pd.DataFrame:
+    return _with_engagement_rate(pd.DataFrame({
+        "video_id": pd.Series(dtype="string"),
+        "title": pd.Series(dtype="string"),
+        "published_at": pd.Series(dtype="datetime64[ns, UTC]"),
+        "view_count": pd.Series(dtype="int64"),
+        "like_count": pd.Series(dtype="int64"),
+        "comment_count": pd.Series(dtype="int64"),
+    }))
+
+
+def _comment_record(thread: Dict) -> Dict:
+    """Flatten a ``commentThreads`` item into the fields the analysis uses."""
+    comment_data = thread["snippet"]["topLevelComment"]["snippet"]
+    return {
+        "textDisplay": comment_data["textDisplay"],
+        "likeCount": comment_data.get("likeCount", 0),
+        "totalReplyCount": thread["snippet"].get("totalReplyCount", 0),
+        "publishedAt": comment_data["publishedAt"]
+    }
+
+
+@dataclass(slots=True)
 class CreatorPersonalityProfile:
     """Comprehensive creator personality and brand suitability profile."""
     # Core personality traits
@@ -127,8 +345,12 @@ class CreatorPersonalityProfile:
     brand_mention_analysis: List[Dict]  # All brands/products mentioned
     audience_receptivity: float  # How audience responds to commercial content
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Field values as a plain dict (shallow, unlike ``dataclasses.asdict``)."""
+        return {name: getattr(self, name) for name in self.__slots__}
 
-@dataclass
+
+@dataclass(slots=True)
 class SponsoredContentAnalysis:
     """Analysis of sponsored content and brand mentions."""
     video_id: str
@@ -138,8 +360,12 @@ class SponsoredContentAnalysis:
     audience_reaction_to_sponsors: Dict[str, Any]  # positive/negative sentiment, engagement impact
     impression_metrics: Dict[str, int]  # view_count, engagement_during_mention, click_through_indicators
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Field values as a plain dict (shallow, unlike ``dataclasses.asdict``)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
-@dataclass
+@dataclass(slots=True)
 class BrandFocusedVideoResult:
     """Enhanced video analysis result focused on brand decision-making."""
     video_id: str
@@ -153,12 +379,12 @@ class BrandFocusedVideoResult:
     # Creator insights
     creator_profile: Optional[CreatorPersonalityProfile] = None
     content_category: str = "Uncategorized"
-    content_subcategories: List[str] = None
+    content_subcategories: List[str] = field(default_factory=list)
     
     # Brand analysis
     sponsored_analysis: Optional[SponsoredContentAnalysis] = None
-    brand_safety_flags: List[str] = None
-    commercial_viability: Dict[str, Any] = None
+    brand_safety_flags: List[str] = field(default_factory=list)
+    commercial_viability: Dict[str, Any] = field(default_factory=dict)
     
     # Engagement data
     video_metrics: Optional[Dict] = None  # views, likes, comments, engagement_rate
@@ -168,6 +394,151 @@ class BrandFocusedVideoResult:
     processing_time_seconds: Optional[float] = None
     processing_date: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Field values as a plain dict, with nested profiles converted too."""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        for name in ("creator_profile", "sponsored_analysis"):
+            if data[name] is not None:
+                data[name] = data[name].to_dict()
+        return data
+
+
+CREATOR_ANALYSIS_INSTRUCTIONS = """Provide detailed brand decision insights:
+
+## CREATOR PERSONALITY PROFILE
+**Communication Style:**
+- Speaking pace (slow/moderate/fast)
+- Tone (casual/professional/enthusiastic/authoritative)
+- Language complexity (simple/intermediate/advanced)
+- Engagement approach (direct/storytelling/educational/entertaining)
+
+**Voice Characteristics:**
+- Energy level (low/moderate/high)
+- Enthusiasm level (reserved/moderate/very enthusiastic)
+- Authority presence (low/moderate/high)
+- Relatability factor (low/moderate/high)
+
+**Content Philosophy:**
+- Core values demonstrated
+- Content consistency quality
+- Message clarity and focus
+- Educational vs entertainment balance
+
+## BRAND SUITABILITY SCORES (0-100)
+**Professionalism Score:** [0-100]
+**Brand Safety Score:** [0-100] 
+**Audience Influence Power:** [0-100]
+
+**Controversy Risk:** [Low/Medium/High]
+
+## AUTHENTICITY ASSESSMENT (0-100)
+**Creator Authenticity:** [0-100] (genuine personality, natural delivery)
+**Content Authenticity:** [0-100] (original thoughts, personal experience)
+
+## COMMERCIAL VIABILITY
+**Sponsored Content Integration:**
+- How naturally they integrate sponsors
+- Transparency level with disclosures
+- Audience acceptance of commercial content
+
+**Brand Mentions Analysis:**
+- List all products/brands mentioned
+- Context of each mention (organic/sponsored/review)
+- Impression impact (high/medium/low visibility)
+
+**Key Brand Partnership Insights:**
+- 3 strengths for brand collaboration
+- 2 potential concerns
+- Recommended partnership approach
+- Audience demographic alignment
+"""
+
+CREATOR_ANALYSIS_SYSTEM_PROMPT = "You are a brand partnership analyst specializing in creator evaluation for marketing campaigns. Focus on commercial viability, brand safety, and audience influence."
+
+
+def _creator_profile_from_analysis(response: str) -> CreatorPersonalityProfile:
+    """Build a creator profile from the LLM's free-text analysis."""
+    # Parse response into structured data (simplified parsing for now)
+    # In production, you'd want more robust parsing
+    return CreatorPersonalityProfile(
+        communication_style={"analysis": response[:500]},
+        voice_characteristics={"analysis": response[500:1000]},
+        content_philosophy={"analysis": response[1000:1500]},
+        professionalism_score=85.0,  # Would extract from response
+        controversy_risk="Low",
+        brand_safety_score=90.0,
+        audience_influence_power=80.0,
+        creator_authenticity=85.0,
+        content_authenticity=80.0,
+        community_authenticity=75.0,  # Will be updated with comments analysis
+        overall_authenticity=80.0,
+        sponsored_content_integration={"quality": "high", "transparency": "good"},
+        brand_mention_analysis=[],  # Would extract from response
+        audience_receptivity=85.0
+    )
+
+
+def _default_creator_profile() -> CreatorPersonalityProfile:
+    """Neutral profile used when no LLM analysis is available."""
+    return CreatorPersonalityProfile(
+        communication_style={"pace": "unknown", "tone": "unknown"},
+        voice_characteristics={"energy_level": "unknown"},
+        content_philosophy={"values_alignment": "unknown"},
+        professionalism_score=50.0,
+        controversy_risk="Unknown",
+        brand_safety_score=50.0,
+        audience_influence_power=50.0,
+        creator_authenticity=50.0,
+        content_authenticity=50.0,
+        community_authenticity=50.0,
+        overall_authenticity=50.0,
+        sponsored_content_integration={"frequency": "unknown"},
+        brand_mention_analysis=[],
+        audience_receptivity=50.0
+    )
+
+
+def _has_creator_material(transcript: str, video_analysis: str) -> bool:
+    """Whether there is enough transcript and visual analysis to be worth an LLM call."""
+    return len((transcript or "").strip()) + len((video_analysis or "").strip()) >= MIN_CREATOR_ANALYSIS_CHARS
+
+
+# One pass over the comments-analysis reply: "FIELD: value" lines (tolerating
+# a list marker and markdown emphasis around the field name) and
+# "1. observation" bullets, the latter used when the reply has no INSIGHTS
+# line. The field alternative comes first, so a numbered field line such as
+# "1. COMMUNITY_AUTHENTICITY: 85" is never read as a bullet.
+_COMMENT_REPLY_RE = re.compile(
+    r"^[ \t]*(?:\d+\.|[-*]|#+)?[ \t]*\**[ \t]*"
+    r"(?P<field>COMMUNITY_AUTHENTICITY|AUDIENCE_LOYALTY|BRAND_RECEPTIVITY|ENGAGEMENT_QUALITY|INSIGHTS)\**\s*:(?P<value>[^\r\n]*)"
+    r"|^[ \t]*[1-5]\.[ \t]*(?P<item>\S[^\r\n]{9,}\S)",
+    re.M,
+)
+# Deletes markdown emphasis from parsed values in one pass
+_STRIP_STARS = str.maketrans("", "", "*")
+# First number in a score value, so "72.5/100" or "72.5 (high)" still parse
+_SCORE_RE = re.compile(r"[-+]?\d*\.?\d+")
+
+
+@lru_cache(maxsize=4096)
+def _resolve_channel_id(channel_input: str) -> Optional[str]:
+    """Resolve a channel ID, URL or handle to the identifier used for lookups.
+
+    Cached at module level so every service instance shares one cache.
+    """
+    if not channel_input.strip():
+        return None
+        
+    # Direct channel ID
+    if channel_input.startswith("UC") and len(channel_input) == 24:
+        return channel_input
+    
+    # Try to extract from URL
+    try:
+        return extract_channel_id_from_url(channel_input)
+    except Exception:
+        return None
+
 
 class BrandFocusedChannelAnalysisService:
     """Enhanced channel analysis service focused on brand decision-making insights."""
@@ -186,91 +557,116 @@ class BrandFocusedChannelAnalysisService:
             "private_access": False,
         }
 
-        for token_file in token_files:
+        _load_oauth_probe_cache()
+        cached_before = dict(_OAUTH_PROBE_CACHE)
+
+        # Probes are independent network round trips; each builds its own
+        # service (and HTTP transport), so they can run side by side.
+        if len(token_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(token_files))) as pool:
+                channels = list(pool.map(self._probe_one_token, token_files))
+        else:
+            channels = [self._probe_one_token(token_file) for token_file in token_files]
+
+        for channel in channels:
+            if channel is None:
+                continue
+            oauth_info["channels"].append(channel)
+            if channel["analytics_access"]:
+                oauth_info["analytics_access"] = True
+                oauth_info["private_access"] = True
+
+        if _OAUTH_PROBE_CACHE != cached_before:
+            _save_oauth_probe_cache()
+
+        return oauth_info
+
+    def _probe_one_token(self, token_file: Path) -> Optional[Dict]:
+        """Return channel info and analytics access for one token file.
+
+        Results are cached until the token file changes on disk; a probe
+        whose analytics query failed transiently is not cached.
+        """
+        cache_key = str(token_file)
+        try:
+            mtime = token_file.stat().st_mtime
+        except OSError:
+            mtime = None
+
+        cached = _OAUTH_PROBE_CACHE.get(cache_key)
+        if cached and cached.get("mtime") == mtime:
+            return {**cached["channel"], "token_file": token_file}
+
+        try:
+            # Test OAuth service
+            oauth_service = get_oauth_service(DEFAULT_CLIENT_SECRET, token_file)
+
+            # Get channel info
+            me = (
+                oauth_service.channels()
+                .list(part="id,snippet,statistics", mine=True)
+                .execute()
+            )
+            if not me["items"]:
+                return None
+
+            channel_info = me["items"][0]
+            channel_id = channel_info["id"]
+
+            # Test analytics access. Only a success or an authorization
+            # refusal is a lasting answer; other errors are retried next run.
+            from googleapiclient.errors import HttpError
+
+            analytics_available = False
+            cacheable = True
             try:
-                # Test OAuth service
-                oauth_service = get_oauth_service(DEFAULT_CLIENT_SECRET, token_file)
+                analytics_service = _get_analytics_service(oauth_service)
+                # Test with a simple query
+                from datetime import date, timedelta
 
-                # Get channel info
-                me = (
-                    oauth_service.channels()
-                    .list(part="id,snippet,statistics", mine=True)
+                end_date = date.today()
+                start_date = end_date - timedelta(days=30)
+
+                test_query = (
+                    analytics_service.reports()
+                    .query(
+                        ids=f"channel=={channel_id}",
+                        startDate=start_date.strftime("%Y-%m-%d"),
+                        endDate=end_date.strftime("%Y-%m-%d"),
+                        metrics="views",
+                        maxResults=1,
+                    )
                     .execute()
                 )
-                if me["items"]:
-                    channel_info = me["items"][0]
-                    channel_id = channel_info["id"]
-
-                    # Test analytics access
-                    analytics_available = False
-                    try:
-                        from googleapiclient.discovery import build
-
-                        analytics_service = build(
-                            "youtubeAnalytics",
-                            "v2",
-                            credentials=oauth_service._http.credentials,
-                        )
-                        # Test with a simple query
-                        from datetime import date, timedelta
-
-                        end_date = date.today()
-                        start_date = end_date - timedelta(days=30)
-
-                        test_query = (
-                            analytics_service.reports()
-                            .query(
-                                ids=f"channel=={channel_id}",
-                                startDate=start_date.strftime("%Y-%m-%d"),
-                                endDate=end_date.strftime("%Y-%m-%d"),
-                                metrics="views",
-                                maxResults=1,
-                            )
-                            .execute()
-                        )
-                        analytics_available = True
-                    except Exception:
-                        analytics_available = False
-
-                    oauth_info["channels"].append(
-                        {
-                            "id": channel_id,
-                            "title": channel_info["snippet"]["title"],
-                            "token_file": token_file,
-                            "analytics_access": analytics_available,
-                            "subscriber_count": int(
-                                channel_info["statistics"].get("subscriberCount", 0)
-                            ),
-                            "video_count": int(
-                                channel_info["statistics"].get("videoCount", 0)
-                            ),
-                        }
-                    )
-
-                    if analytics_available:
-                        oauth_info["analytics_access"] = True
-                        oauth_info["private_access"] = True
+                analytics_available = True
+            except HttpError as e:
+                # Quota and rate-limit errors are 403s too, but temporary
+                cacheable = e.resp.status in (401, 403) and "exceeded" not in str(e).lower()
+            except Exception:
+                cacheable = False
 
-            except Exception as e:
-                logger.error(f"OAuth detection failed for {token_file}: {e}")
+            channel = {
+                "id": channel_id,
+                "title": channel_info["snippet"]["title"],
+                "analytics_access": analytics_available,
+                "subscriber_count": int(
+                    channel_info["statistics"].get("subscriberCount", 0)
+                ),
+                "video_count": int(
+                    channel_info["statistics"].get("videoCount", 0)
+                ),
+            }
+            if cacheable:
+                _OAUTH_PROBE_CACHE[cache_key] = {"mtime": mtime, "channel": channel}
+            return {**channel, "token_file": token_file}
 
-        return oauth_info
+        except Exception as e:
+            logger.error(f"OAuth detection failed for {token_file}: {e}")
+            return None
     
-    @lru_cache(maxsize=128)
     def extract_channel_id(self, channel_input: str) -> Optional[str]:
         """Extract channel ID from various input formats."""
-        if not channel_input.strip():
-            return None
-            
-        # Direct channel ID
-        if channel_input.startswith("UC") and len(channel_input) == 24:
-            return channel_input
-        
-        # Try to extract from URL
-        try:
-            return extract_channel_id_from_url(channel_input)
-        except Exception:
-            return None
+        return _resolve_channel_id(channel_input)
     
     def get_service_for_channel(self, channel_id: str) -> Tuple[object, str]:
         """Get the appropriate service (OAuth or public) for a channel."""
@@ -306,8 +702,62 @@ class BrandFocusedChannelAnalysisService:
             logger.error(f"Failed to fetch channel info: {e}")
             raise
     
-    def get_channel_videos(self, service: object, channel_id: str, max_videos: int = 50) -> List[Dict]:
-        """Fetch videos from a channel with enhanced metadata."""
+    def _list_uploads(self, service: object, playlist_id: str, max_videos: int) -> List[Dict]:
+        """Page through an uploads playlist and return up to *max_videos* item snippets."""
+        snippets: List[Dict] = []
+        next_page_token = None
+        
+        while len(snippets) < max_videos:
+            playlist_response = service.playlistItems().list(
+                part="snippet",
+                playlistId=playlist_id,
+                maxResults=min(50, max_videos - len(snippets)),
+                pageToken=next_page_token
+            ).execute()
+            
+            snippets.extend(item["snippet"] for item in playlist_response["items"])
+            
+            next_page_token = playlist_response.get("nextPageToken")
+            if not next_page_token:
+                break
+        
+        return snippets[:max_videos]
+    
+    def _fetch_video_stats_batch(self, service: object, video_ids: List[str]) -> Dict[str, Dict]:
+        """Fetch statistics for *video_ids*, keyed by video ID.
+        
+        IDs are requested 50 per ``videos().list`` call (the API maximum) and
+        multiple calls are sent together as one batch HTTP request.
+        """
+        requests = [
+            service.videos().list(part="statistics,contentDetails", id=",".join(video_ids[i:i + 50]))
+            for i in range(0, len(video_ids), 50)
+        ]
+        video_stats: Dict[str, Dict] = {}
+        
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.warning(f"Video statistics request failed: {exception}")
+                return
+            video_stats.update({v["id"]: v.get("statistics", {}) for v in response["items"]})
+        
+        if len(requests) == 1:
+            _collect(None, requests[0].execute(), None)
+        elif requests:
+            batch = service.new_batch_http_request(callback=_collect)
+            for request in requests:
+                batch.add(request)
+            batch.execute()
+        
+        return video_stats
+    
+    def get_channel_videos(self, service: object, channel_id: str, max_videos: int = 50) -> pd.DataFrame:
+        """Fetch videos from a channel with enhanced metadata.
+        
+        Returns one row per video with ``video_id``, ``title``,
+        ``published_at`` (UTC), ``view_count``, ``like_count``,
+        ``comment_count`` and ``engagement_rate`` columns.
+        """
         try:
             # Get uploads playlist ID
             channel_response = service.channels().list(
@@ -316,65 +766,41 @@ class BrandFocusedChannelAnalysisService:
             ).execute()
             
             if not channel_response["items"]:
-                return []
+                return _empty_videos_frame()
             
             uploads_playlist_id = channel_response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
             
-            # Get videos from uploads playlist
-            videos = []
-            next_page_token = None
+            # Collect every upload first, then fetch statistics for all of them at once
+            snippets = self._list_uploads(service, uploads_playlist_id, max_videos)
+            video_ids = [snippet["resourceId"]["videoId"] for snippet in snippets]
+            video_stats = self._fetch_video_stats_batch(service, video_ids)
             
-            while len(videos) < max_videos:
-                playlist_response = service.playlistItems().list(
-                    part="snippet",
-                    playlistId=uploads_playlist_id,
-                    maxResults=min(50, max_videos - len(videos)),
-                    pageToken=next_page_token
-                ).execute()
-                
-                video_ids = []
-                for item in playlist_response["items"]:
-                    video_id = item["snippet"]["resourceId"]["videoId"]
-                    video_ids.append(video_id)
-                
-                # Get detailed video statistics
-                if video_ids:
-                    video_details = service.videos().list(
-                        part="statistics,contentDetails",
-                        id=",".join(video_ids)
-                    ).execute()
-                    
-                    video_stats = {v["id"]: v for v in video_details["items"]}
-                
-                for item in playlist_response["items"]:
-                    video_id = item["snippet"]["resourceId"]["videoId"]
-                    video_title = item["snippet"]["title"]
-                    published_at = item["snippet"]["publishedAt"]
-                    
-                    # Add video statistics
-                    stats = video_stats.get(video_id, {}).get("statistics", {})
-                    
-                    videos.append({
-                        "video_id": video_id,
-                        "title": video_title,
-                        "published_at": published_at,
-                        "view_count": int(stats.get("viewCount", 0)),
-                        "like_count": int(stats.get("likeCount", 0)),
-                        "comment_count": int(stats.get("commentCount", 0))
-                    })
-                
-                next_page_token = playlist_response.get("nextPageToken")
-                if not next_page_token:
-                    break
+            views, likes, comment_counts = [], [], []
+            for video_id in video_ids:
+                stats = video_stats.get(video_id, {})
+                views.append(int(stats.get("viewCount", 0)))
+                likes.append(int(stats.get("likeCount", 0)))
+                comment_counts.append(int(stats.get("commentCount", 0)))
             
-            return videos[:max_videos]
+            videos = pd.DataFrame({
+                "video_id": pd.Series(video_ids, dtype="string"),
+                "title": pd.Series([snippet["title"] for snippet in snippets], dtype="string"),
+                "published_at": pd.to_datetime([snippet["publishedAt"] for snippet in snippets], utc=True),
+                "view_count": pd.Series(views, dtype="int64"),
+                "like_count": pd.Series(likes, dtype="int64"),
+                "comment_count": pd.Series(comment_counts, dtype="int64"),
+            })
+            return _with_engagement_rate(videos)
             
         except Exception as e:
             logger.error(f"Failed to fetch channel videos: {e}")
-            return []
+            return _empty_videos_frame()
     
-    def get_video_comments(self, service: object, video_id: str, max_comments: int = 100) -> List[Dict]:
-        """Fetch comments for a video for authenticity analysis."""
+    def get_video_comments(self, service: object, video_id: str, max_comments: int = 100, http: object = None) -> List[Dict]:
+        """Fetch comments for a video for authenticity analysis.
+        
+        Pass a dedicated *http* transport when calling from a worker thread.
+        """
         try:
             comments = []
             next_page_token = None
@@ -386,16 +812,9 @@ class BrandFocusedChannelAnalysisService:
                     maxResults=min(100, max_comments - len(comments)),
                     order="relevance",  # Get most relevant comments first
                     pageToken=next_page_token
-                ).execute()
+                ).execute(http=http, num_retries=3)
                 
-                for item in response["items"]:
-                    comment_data = item["snippet"]["topLevelComment"]["snippet"]
-                    comments.append({
-                        "textDisplay": comment_data["textDisplay"],
-                        "likeCount": comment_data.get("likeCount", 0),
-                        "totalReplyCount": item["snippet"].get("totalReplyCount", 0),
-                        "publishedAt": comment_data["publishedAt"]
-                    })
+                comments.extend(_comment_record(item) for item in response["items"])
                 
                 next_page_token = response.get("nextPageToken")
                 if not next_page_token:
@@ -407,55 +826,82 @@ class BrandFocusedChannelAnalysisService:
             logger.warning(f"Failed to fetch comments for {video_id}: {e}")
             return []
     
+    def get_video_comments_batch(self, service: object, video_ids: List[str], max_comments: int = 100) -> Dict[str, List[Dict]]:
+        """Fetch comments for several videos, keyed by video ID.
+        
+        Each round sends the next ``commentThreads().list`` page of every
+        unfinished video as one batch HTTP request (up to 50 calls each), so
+        N videos cost one round trip per page rather than N. Videos whose
+        comments cannot be fetched (e.g. comments disabled) map to ``[]``.
+        """
+        comments: Dict[str, List[Dict]] = {video_id: [] for video_id in video_ids}
+        page_tokens: Dict[str, Optional[str]] = {video_id: None for video_id in comments}
+        
+        def _collect(video_id, response, exception):
+            if exception is not None:
+                logger.warning(f"Failed to fetch comments for {video_id}: {exception}")
+                del page_tokens[video_id]
+                return
+            comments[video_id].extend(_comment_record(item) for item in response["items"])
+            next_page_token = response.get("nextPageToken")
+            if next_page_token and len(comments[video_id]) < max_comments:
+                page_tokens[video_id] = next_page_token
+            else:
+                del page_tokens[video_id]
+        
+        while page_tokens:
+            pending = list(page_tokens.items())
+            for i in range(0, len(pending), 50):
+                batch = service.new_batch_http_request(callback=_collect)
+                for video_id, page_token in pending[i:i + 50]:
+                    batch.add(
+                        service.commentThreads().list(
+                            part="snippet",
+                            videoId=video_id,
+                            maxResults=min(100, max_comments - len(comments[video_id])),
+                            order="relevance",  # Get most relevant comments first
+                            pageToken=page_token
+                        ),
+                        request_id=video_id
+                    )
+                try:
+                    batch.execute()
+                except Exception as e:
+                    logger.warning(f"Comments batch request failed: {e}")
+                    for video_id, _ in pending[i:i + 50]:
+                        page_tokens.pop(video_id, None)
+        
+        return {video_id: items[:max_comments] for video_id, items in comments.items()}
+    
     def categorize_content(self, title: str, transcript: str, video_analysis: str) -> Tuple[str, List[str]]:
         """Categorize content using the comprehensive content dictionary with improved accuracy."""
         # Combine content with title having higher weight
         title_text = title.lower()
-        transcript_text = transcript[:3000].lower() if transcript else ""
+        transcript_text = transcript[:TRANSCRIPT_CONTEXT_CHARS].lower() if transcript else ""
         analysis_text = video_analysis[:1000].lower() if video_analysis else ""
         
-        # Create weighted content - title is most important
-        content_text = f"{title_text} {title_text} {transcript_text} {analysis_text}"
-        
-        category_scores = {}
-        all_matched_keywords = []
-        
-        for category, keywords in CONTENT_CATEGORIES.items():
-            score = 0
-            matched_keywords = []
-            
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                
-                # Count occurrences with different weights
-                title_matches = title_text.count(keyword_lower) * 3  # Title gets 3x weight
-                transcript_matches = transcript_text.count(keyword_lower) * 1  # Regular weight
-                analysis_matches = analysis_text.count(keyword_lower) * 0.5  # Analysis gets 0.5x weight
-                
-                total_matches = title_matches + transcript_matches + analysis_matches
-                
-                if total_matches > 0:
-                    score += total_matches
-                    matched_keywords.append(keyword)
-            
-            if score > 0:
-                category_scores[category] = score
-                all_matched_keywords.extend(matched_keywords)
-        
-        # Filter out generic keywords that don't add value as subcategories
-        filtered_keywords = []
-        generic_words = {"brand partnership", "partnership", "brand", "content", "video", "youtube", "analysis", "review"}
+        # Title gets 3x weight, transcript regular weight, analysis 0.5x weight.
+        # Subcategories are ranked by plain occurrences, counting the title twice.
+        hits = [_keyword_hits(title_text), _keyword_hits(transcript_text), _keyword_hits(analysis_text)]
+        sizes = [len(h) for h in hits]
+        term_ids = np.concatenate(hits)
+        term_scores = np.bincount(term_ids, weights=np.repeat([3, 1, 0.5], sizes), minlength=len(_TERMS))
+        term_counts = np.bincount(term_ids, weights=np.repeat([2, 1, 1], sizes), minlength=len(_TERMS))
         
-        for keyword in set(all_matched_keywords):
-            if keyword.lower() not in generic_words and len(keyword) > 2:
-                filtered_keywords.append(keyword)
+        category_scores = np.bincount(
+            _KEYWORD_CATEGORY, weights=term_scores[_KEYWORD_TERM], minlength=len(_CATEGORY_NAMES)
+        )
         
         # Return primary category and meaningful subcategories
-        if category_scores:
-            primary_category = max(category_scores, key=category_scores.get)
+        if category_scores.any():
+            # argmax picks the first category listed on ties, as before
+            primary_category = _CATEGORY_NAMES[int(category_scores.argmax())]
             
-            # Limit subcategories to top 5 most relevant ones
-            relevant_subcategories = sorted(filtered_keywords, key=lambda x: content_text.count(x.lower()), reverse=True)[:5]
+            # Limit subcategories to top 5 most relevant ones; the stable sort
+            # keeps listing order among keywords with equal counts
+            candidates = np.flatnonzero((term_counts > 0) & _SUBCATEGORY_CANDIDATE)
+            top = candidates[np.argsort(-term_counts[candidates], kind="stable")[:5]]
+            relevant_subcategories = [_TERM_LABELS[i] for i in top]
             
             return primary_category, relevant_subcategories
         else:
@@ -466,112 +912,34 @@ class BrandFocusedChannelAnalysisService:
         
         if not (SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys):
             # Return default profile if no LLM available
-            return CreatorPersonalityProfile(
-                communication_style={"pace": "unknown", "tone": "unknown"},
-                voice_characteristics={"energy_level": "unknown"},
-                content_philosophy={"values_alignment": "unknown"},
-                professionalism_score=50.0,
-                controversy_risk="Unknown",
-                brand_safety_score=50.0,
-                audience_influence_power=50.0,
-                creator_authenticity=50.0,
-                content_authenticity=50.0,
-                community_authenticity=50.0,
-                overall_authenticity=50.0,
-                sponsored_content_integration={"frequency": "unknown"},
-                brand_mention_analysis=[],
-                audience_receptivity=50.0
-            )
+            return _default_creator_profile()
         
-        client = get_smart_client()
+        # Nothing worth sending: no speech to speak of and no visual analysis
+        if not _has_creator_material(transcript, video_analysis):
+            return _default_creator_profile()
         
         brand_analysis_prompt = f"""
 BRAND PARTNERSHIP ANALYSIS: Analyze this creator for brand collaboration suitability.
 
 VIDEO: {video_title}
-TRANSCRIPT: {transcript[:3000]}
+TRANSCRIPT: {transcript[:TRANSCRIPT_CONTEXT_CHARS]}
 VISUAL ANALYSIS: {video_analysis}
 
-Provide detailed brand decision insights:
-
-## CREATOR PERSONALITY PROFILE
-**Communication Style:**
-- Speaking pace (slow/moderate/fast)
-- Tone (casual/professional/enthusiastic/authoritative)
-- Language complexity (simple/intermediate/advanced)
-- Engagement approach (direct/storytelling/educational/entertaining)
-
-**Voice Characteristics:**
-- Energy level (low/moderate/high)
-- Enthusiasm level (reserved/moderate/very enthusiastic)
-- Authority presence (low/moderate/high)
-- Relatability factor (low/moderate/high)
-
-**Content Philosophy:**
-- Core values demonstrated
-- Content consistency quality
-- Message clarity and focus
-- Educational vs entertainment balance
-
-## BRAND SUITABILITY SCORES (0-100)
-**Professionalism Score:** [0-100]
-**Brand Safety Score:** [0-100] 
-**Audience Influence Power:** [0-100]
-
-**Controversy Risk:** [Low/Medium/High]
-
-## AUTHENTICITY ASSESSMENT (0-100)
-**Creator Authenticity:** [0-100] (genuine personality, natural delivery)
-**Content Authenticity:** [0-100] (original thoughts, personal experience)
-
-## COMMERCIAL VIABILITY
-**Sponsored Content Integration:**
-- How naturally they integrate sponsors
-- Transparency level with disclosures
-- Audience acceptance of commercial content
-
-**Brand Mentions Analysis:**
-- List all products/brands mentioned
-- Context of each mention (organic/sponsored/review)
-- Impression impact (high/medium/low visibility)
-
-**Key Brand Partnership Insights:**
-- 3 strengths for brand collaboration
-- 2 potential concerns
-- Recommended partnership approach
-- Audience demographic alignment
-
+{CREATOR_ANALYSIS_INSTRUCTIONS}
 Return structured analysis focusing on brand decision-making factors.
 """
         
         try:
-            response = client.chat(
+            response = cached_chat(
                 [
-                    {"role": "system", "content": "You are a brand partnership analyst specializing in creator evaluation for marketing campaigns. Focus on commercial viability, brand safety, and audience influence."},
+                    {"role": "system", "content": CREATOR_ANALYSIS_SYSTEM_PROMPT},
                     {"role": "user", "content": brand_analysis_prompt}
                 ],
                 temperature=0.2,
                 max_tokens=2000,
             )
             
-            # Parse response into structured data (simplified parsing for now)
-            # In production, you'd want more robust parsing
-            return CreatorPersonalityProfile(
-                communication_style={"analysis": response[:500]},
-                voice_characteristics={"analysis": response[500:1000]},
-                content_philosophy={"analysis": response[1000:1500]},
-                professionalism_score=85.0,  # Would extract from response
-                controversy_risk="Low",
-                brand_safety_score=90.0,
-                audience_influence_power=80.0,
-                creator_authenticity=85.0,
-                content_authenticity=80.0,
-                community_authenticity=75.0,  # Will be updated with comments analysis
-                overall_authenticity=80.0,
-                sponsored_content_integration={"quality": "high", "transparency": "good"},
-                brand_mention_analysis=[],  # Would extract from response
-                audience_receptivity=85.0
-            )
+            return _creator_profile_from_analysis(response)
             
         except Exception as e:
             logger.error(f"Creator personality analysis failed: {e}")
@@ -604,19 +972,25 @@ Return structured analysis focusing on brand decision-making factors.
                 "community_insights": ["No comments available for analysis"]
             }
         
-        client = get_smart_client()
-        
-        # Prepare comments for analysis
-        comment_sample = []
-        for i, comment in enumerate(comments[:50]):  # Analyze top 50 comments
-            text = comment.get('textDisplay', '')
-            likes = comment.get('likeCount', 0)
-            replies = comment.get('totalReplyCount', 0)
-            # Truncate very long comments
-            truncated_text = text[:100] + "..." if len(text) > 100 else text
-            comment_sample.append(f"{i+1}. [{likes}❤️ {replies}💬] {truncated_text}")
+        if (
+            len(comments) < MIN_COMMENTS_FOR_ANALYSIS
+            or sum(len(c.get("textDisplay", "")) for c in comments) < MIN_COMMENT_ANALYSIS_CHARS
+        ):
+            return {
+                "community_authenticity": 50.0,
+                "audience_loyalty": 50.0,
+                "brand_receptivity": 50.0,
+                "engagement_quality": "insufficient_data",
+                "community_insights": ["Too few comments for analysis"],
+                "total_comments_analyzed": len(comments)
+            }
         
-        comments_text = chr(10).join(comment_sample)
+        # Prepare top 50 comments for analysis, truncating very long ones
+        comments_text = "\n".join(
+            f"{i}. [{c.get('likeCount', 0)}❤️ {c.get('totalReplyCount', 0)}💬] "
+            f"{_truncate(c.get('textDisplay', ''), 100)}"
+            for i, c in enumerate(comments[:50], 1)
+        )
         
         from prompts.comments_analysis import get_comments_sentiment_analysis_prompt
         
@@ -657,7 +1031,7 @@ INSIGHTS: [5 specific observations for brand decision-making]
 """
         
         try:
-            response = client.chat(
+            response = cached_chat(
                 [
                     {"role": "system", "content": "You are a brand partnership analyst evaluating creator communities for commercial viability. Focus on audience authenticity, brand receptivity, and purchase influence potential."},
                     {"role": "user", "content": brand_comments_prompt}
@@ -673,42 +1047,35 @@ INSIGHTS: [5 specific observations for brand decision-making]
             engagement_quality = "Medium"
             insights = []
             
-            for line in response.strip().split('\n'):
-                clean_line = line.strip().replace('**', '').replace('*', '')
+            numbered_fallback = []
+            
+            for match in _COMMENT_REPLY_RE.finditer(response):
+                field_name = match.group('field')
+                if field_name is None:
+                    numbered_fallback.append(match.group('item'))
+                    continue
+                value = match.group('value').translate(_STRIP_STARS).strip()
                 
-                if 'COMMUNITY_AUTHENTICITY:' in clean_line:
-                    try:
-                        community_authenticity = float(clean_line.split(':')[1].strip())
-                    except (ValueError, IndexError):
-                        pass
-                elif 'AUDIENCE_LOYALTY:' in clean_line:
-                    try:
-                        audience_loyalty = float(clean_line.split(':')[1].strip())
-                    except (ValueError, IndexError):
-                        pass
-                elif 'BRAND_RECEPTIVITY:' in clean_line:
-                    try:
-                        brand_receptivity = float(clean_line.split(':')[1].strip())
-                    except (ValueError, IndexError):
-                        pass
-                elif 'ENGAGEMENT_QUALITY:' in clean_line:
-                    try:
-                        engagement_quality = clean_line.split(':')[1].strip()
-                    except IndexError:
-                        pass
-                elif 'INSIGHTS:' in clean_line:
-                    insights_text = clean_line.split(':', 1)[1].strip()
-                    if insights_text:
-                        insights = [insight.strip() for insight in insights_text.split(';') if insight.strip()]
-            
-            # Extract numbered insights if not found
+                if field_name == 'INSIGHTS':
+                    if value:
+                        insights = [insight.strip() for insight in value.split(';') if insight.strip()]
+                elif field_name == 'ENGAGEMENT_QUALITY':
+                    engagement_quality = value.split(':')[0].strip()
+                else:
+                    score_match = _SCORE_RE.search(value)
+                    if score_match is None:
+                        continue
+                    score = float(score_match.group())
+                    if field_name == 'COMMUNITY_AUTHENTICITY':
+                        community_authenticity = score
+                    elif field_name == 'AUDIENCE_LOYALTY':
+                        audience_loyalty = score
+                    else:
+                        brand_receptivity = score
+            
+            # Fall back to numbered insights if no INSIGHTS line was found
             if not insights:
-                for line in response.strip().split('\n'):
-                    clean_line = line.strip()
-                    if clean_line and (clean_line.startswith(('1.', '2.', '3.', '4.', '5.'))):
-                        insight_text = clean_line[2:].strip()
-                        if insight_text and len(insight_text) > 10:
-                            insights.append(insight_text)
+                insights = numbered_fallback
             
             return {
                 "community_authenticity": community_authenticity,
@@ -730,8 +1097,18 @@ INSIGHTS: [5 specific observations for brand decision-making]
                 "total_comments_analyzed": len(comments)
             }
     
-    def process_single_video_for_brands(self, video_info: Dict, output_base_dir: Path, service: object) -> BrandFocusedVideoResult:
-        """Process a single video with comprehensive brand-focused analysis."""
+    def process_single_video_for_brands(
+        self,
+        video_info: Dict,
+        output_base_dir: Path,
+        service: object,
+        comments: Optional[List[Dict]] = None,
+    ) -> BrandFocusedVideoResult:
+        """Process a single video with comprehensive brand-focused analysis.
+        
+        *comments* may be pre-fetched (see ``get_video_comments_batch``);
+        otherwise they are fetched alongside transcription.
+        """
         
         video_id = video_info["video_id"]
         video_title = video_info["title"]
@@ -743,16 +1120,21 @@ INSIGHTS: [5 specific observations for brand decision-making]
         
         # Check if already processed
         summary_file = video_dir / f"{video_id}_brand_analysis.json"
+        # One-line sidecar holding duration_minutes, so skipping a processed
+        # video does not have to parse its full summary
+        meta_file = video_dir / f"{video_id}.meta"
         if summary_file.exists():
             logger.info(f"Video {video_id} already processed, skipping...")
             try:
-                with open(summary_file, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+                skipped_duration = _read_duration_meta(meta_file)
+                if skipped_duration is None:
+                    # Summaries written before the sidecar was introduced
+                    skipped_duration = _read_json(summary_file).get("duration_minutes", 0)
                 return BrandFocusedVideoResult(
                     video_id=video_id,
                     title=video_title,
                     url=video_url,
-                    duration_minutes=existing_data.get("duration_minutes", 0),
+                    duration_minutes=skipped_duration,
                     success=True,
                     skipped=True
                 )
@@ -768,46 +1150,87 @@ INSIGHTS: [5 specific observations for brand decision-making]
         )
         
         try:
-            # Step 1: Download and extract content
-            duration_minutes = get_video_duration_from_url(video_url)
+            # Step 1: Download and extract content. A run that crashed before
+            # writing the summary leaves the video, its duration and the
+            # finished stage outputs behind, so resume from those.
+            transcript_file = video_dir / "transcript.txt"
+            video_analysis_file = video_dir / "video_analysis.txt"
+            # yt-dlp only renames its .part file once the download completes
+            existing_mp4 = video_dir / f"{video_id}.mp4"
+            if not (existing_mp4.exists() and existing_mp4.stat().st_size > 0):
+                existing_mp4 = None
+            duration_minutes = _read_duration_meta(meta_file) if existing_mp4 else None
+            if duration_minutes is None:
+                duration_minutes = get_video_duration_from_url(video_url)
+                meta_file.write_text(f"{duration_minutes}\n", encoding="utf-8")
             result.duration_minutes = duration_minutes
-            quality = auto_select_video_quality(duration_minutes)
             
-            mp4_path = download_video(video_url, video_dir, quality=quality)
+            mp4_path = existing_mp4 or download_video(
+                video_url, video_dir, quality=auto_select_video_quality(duration_minutes)
+            )
             
-            # Step 2: Audio analysis
-            wav_path = extract_audio(mp4_path, video_dir / "audio.wav")
-            segments = transcribe_audio(wav_path)
-            full_transcript = ""
-            if segments:
-                full_transcript = "\n".join(s.get("text", "") for s in segments)
+            # Steps 2, 3 and 7a are independent and I/O/LLM-bound, so run the
+            # transcription, frame analysis and comment fetch concurrently
+            def _transcribe() -> str:
+                transcript = _read_checkpoint(transcript_file)
+                if transcript is None:
+                    segments = transcribe_audio(load_audio(mp4_path))
+                    transcript = _transcript_prefix(segments) if segments else ""
+                    # A failed transcription also yields no segments; leave
+                    # the checkpoint unwritten so the next run retries
+                    if segments:
+                        transcript_file.write_text(transcript, encoding="utf-8")
+                return transcript
             
-            # Step 3: Video frame analysis  
-            frames = extract_frames(mp4_path, video_dir / "frames", every_sec=15)
-            video_analysis = ""
-            if frames:
-                frames = frames[:10]  # Analyze 10 frames
-                if SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys:
-                    video_analysis = summarise_frames(frames, prompt="Analyze visual content, products shown, brand elements, and production quality for brand partnership assessment.")
+            def _analyse_frames() -> str:
+                video_analysis = _read_checkpoint(video_analysis_file)
+                if video_analysis is not None:
+                    return video_analysis
+                # Frames only feed the vision model, so keep them off disk
+                frames = extract_frame_images(mp4_path, every_sec=15, limit=10)  # Analyze 10 frames
+                if not frames:
+                    return ""
+                if not (SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys):
+                    return ""
+                video_analysis = summarise_frames(frames, prompt="Analyze visual content, products shown, brand elements, and production quality for brand partnership assessment.")
+                if video_analysis:
+                    video_analysis_file.write_text(video_analysis, encoding="utf-8")
+                return video_analysis
+            
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                # Step 2: Audio analysis
+                f_transcript = pool.submit(_transcribe)
+                # Step 3: Video frame analysis
+                f_frames = pool.submit(_analyse_frames)
+                # Step 7a: Comments fetch (own http, httplib2 is not thread-safe)
+                f_comments = None
+                if comments is None:
+                    f_comments = pool.submit(
+                        self.get_video_comments, service, video_id, 100, _thread_http(service)
+                    )
+                transcript = f_transcript.result()
+                video_analysis = f_frames.result()
+                if f_comments is not None:
+                    comments = f_comments.result()
             
             # Step 4: Content categorization
-            primary_category, subcategories = self.categorize_content(video_title, full_transcript, video_analysis)
+            primary_category, subcategories = self.categorize_content(video_title, transcript, video_analysis)
             result.content_category = primary_category
             result.content_subcategories = subcategories
             
             # Step 5: Creator personality analysis
-            creator_profile = self.analyze_creator_personality(full_transcript, video_analysis, video_title)
+            creator_profile = self.analyze_creator_personality(transcript, video_analysis, video_title)
             result.creator_profile = creator_profile
             
             # Step 6: Get video metrics
             result.video_metrics = {
                 "view_count": video_info.get("view_count", 0),
                 "like_count": video_info.get("like_count", 0),
-                "comment_count": video_info.get("comment_count", 0)
+                "comment_count": video_info.get("comment_count", 0),
+                "engagement_rate": video_info.get("engagement_rate", 0.0)
             }
             
             # Step 7: Comments analysis for community authenticity
-            comments = self.get_video_comments(service, video_id, max_comments=100)
             comments_analysis = self.analyze_comments_for_brand_insights(comments, video_title)
             result.comments_analysis = comments_analysis
             
@@ -835,22 +1258,20 @@ INSIGHTS: [5 specific observations for brand decision-making]
                 "processing_time_seconds": processing_time,
                 "content_category": result.content_category,
                 "content_subcategories": result.content_subcategories,
-                "creator_profile": asdict(result.creator_profile) if result.creator_profile else None,
+                "creator_profile": result.creator_profile,
                 "comments_analysis": result.comments_analysis,
                 "video_metrics": result.video_metrics,
-                "transcript_excerpt": full_transcript[:1000],
+                "transcript_excerpt": transcript[:1000],
                 "video_analysis_excerpt": video_analysis[:1000]
             }
             
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(brand_analysis_data, f, indent=2, ensure_ascii=False)
+            _write_json(summary_file, brand_analysis_data)
             
-            # Cleanup files
+            # Cleanup files. The stage checkpoints go too, so deleting the
+            # summary to force a re-analysis starts from scratch.
             try:
-                if mp4_path.exists():
-                    mp4_path.unlink()
-                if wav_path.exists():
-                    wav_path.unlink()
+                for path in (mp4_path, transcript_file, video_analysis_file):
+                    path.unlink(missing_ok=True)
             except Exception as cleanup_error:
                 logger.warning(f"Cleanup failed for {video_id}: {cleanup_error}")
             
@@ -876,19 +1297,37 @@ INSIGHTS: [5 specific observations for brand decision-making]
         # Get videos list with metrics
         videos = self.get_channel_videos(service, channel_id, max_videos)
         
-        if not videos:
+        if videos.empty:
             return {"success": False, "error": "No videos found or failed to fetch videos"}
         
-        # Process each video
-        results = []
+        video_list = videos.to_dict("records")
+        
+        # Fetch comments for every unprocessed video up front in batched requests
+        pending_ids = [
+            video_info["video_id"] for video_info in video_list
+            if not (output_dir / video_info["video_id"] / f"{video_info['video_id']}_brand_analysis.json").exists()
+        ]
+        comments_by_video = self.get_video_comments_batch(service, pending_ids, max_comments=100)
+        
+        # Process videos concurrently; each worker thread builds its own
+        # service because googleapiclient/httplib2 objects are not thread-safe
+        worker = threading.local()
+        
+        def _process(video_info: Dict) -> BrandFocusedVideoResult:
+            if not hasattr(worker, "service"):
+                worker.service, _ = self.get_service_for_channel(channel_id)
+            return self.process_single_video_for_brands(
+                video_info, output_dir, worker.service, comments_by_video.get(video_info["video_id"])
+            )
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(SETTINGS.video_parallelism, len(video_list)))) as pool:
+            results = list(pool.map(_process, video_list))
+        
         successful_analyses = 0
         failed_analyses = 0
         skipped_analyses = 0
         
-        for video_info in videos:
-            result = self.process_single_video_for_brands(video_info, output_dir, service)
-            results.append(result)
-            
+        for result in results:
             if result.success:
                 if result.skipped:
                     skipped_analyses += 1
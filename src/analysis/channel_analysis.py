@@ -16,6 +16,7 @@ from collections import Counter
 import pandas as pd
 
 from src.youtube.oauth import get_service as get_oauth_service
+from src.youtube.analytics import _get_analytics_service
 from src.youtube.public import get_service as get_public_service, extract_channel_id_from_url
 from src.analysis.video_frames import (
     extract_video_id,
@@ -24,9 +25,9 @@ from src.analysis.video_frames import (
     get_video_duration_from_url,
     auto_select_video_quality,
 )
-from src.analysis.audio import extract_audio, transcribe as transcribe_audio
+from src.analysis.audio import load_audio, transcribe as transcribe_audio
 from src.analysis.video_vision import summarise_frames
-from src.llms import get_smart_client
+from src.llms import cached_chat
 from src.prompts.audio_analysis import get_enhanced_audio_analysis_prompt
 from src.prompts.video_summary import get_channel_collective_analysis_prompt
 from src.config.settings import SETTINGS
@@ -95,13 +96,7 @@ class ChannelAnalysisService:
                     # Test analytics access
                     analytics_available = False
                     try:
-                        from googleapiclient.discovery import build
-
-                        analytics_service = build(
-                            "youtubeAnalytics",
-                            "v2",
-                            credentials=oauth_service._http.credentials,
-                        )
+                        analytics_service = _get_analytics_service(oauth_service)
                         # Test with a simple query
                         from datetime import date, timedelta
 
@@ -290,25 +285,23 @@ class ChannelAnalysisService:
             mp4_path = download_video(video_url, video_dir, quality=quality)
             
             # Step 2: Enhanced Audio Analysis
-            # Extract audio
-            wav_path = extract_audio(mp4_path, video_dir / "audio.wav")
+            # Decode audio in-process (no intermediate WAV file)
+            audio = load_audio(mp4_path)
             
             # Transcribe
-            segments = transcribe_audio(wav_path)
+            segments = transcribe_audio(audio)
             full_transcript = ""
             if segments:
                 full_transcript = "\n".join(s.get("text", "") for s in segments)
                 
                 # Enhanced audio analysis with LLM
                 if SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys:
-                    client = get_smart_client()
-                    
                     # Add video context to the transcript for analysis
                     transcript_with_context = f"Video Title: {video_title}\nVideo Duration: ~{duration_minutes} minutes\n\nTranscript:\n{full_transcript}"
                     enhanced_audio_prompt = get_enhanced_audio_analysis_prompt(transcript_with_context)
                     
                     try:
-                        audio_summary = client.chat(
+                        audio_summary = cached_chat(
                             [
                                 {"role": "system", "content": "You are an expert video content analyst. Provide detailed, structured analysis following the exact format requested."},
                                 {"role": "user", "content": enhanced_audio_prompt},
@@ -323,16 +316,15 @@ class ChannelAnalysisService:
                         basic_prompt = (
                             "Analyze this video transcript and provide: 1) Content summary, 2) Sentiment, 3) Content type, 4) Any products/brands mentioned."
                         )
-                        result["audio_analysis"] = client.chat(
+                        result["audio_analysis"] = cached_chat(
                             [{"role": "system", "content": basic_prompt}, {"role": "user", "content": full_transcript[:8000]}],
                             temperature=0.3, max_tokens=800,
                         )
             
             # Step 3: Enhanced Video Analysis (frames)
-            frames = extract_frames(mp4_path, video_dir / "frames", every_sec=10)  # Every 10 seconds for better coverage
+            # Every 10 seconds for better coverage, 12 frames for better analysis
+            frames = extract_frames(mp4_path, video_dir / "frames", every_sec=10, limit=12)
             if frames:
-                frames = frames[:12]  # Increase to 12 frames for better analysis
-                
                 if SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys:
                     enhanced_video_prompt = f"""Analyze these video frames and provide insights about:
 
@@ -406,8 +398,7 @@ Return only the JSON object above, filled with actual data from the analysis:"""
 
                 try:
                     if SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys:
-                        client = get_smart_client()
-                        structured_response = client.chat(
+                        structured_response = cached_chat(
                             [{"role": "system", "content": "You are a data extraction specialist. Return only valid JSON without any markdown formatting or additional text."}, 
                              {"role": "user", "content": structured_analysis_prompt}],
                             temperature=0.1, max_tokens=1000,
@@ -591,8 +582,6 @@ Return only the JSON object above, filled with actual data from the analysis:"""
             try:
                 if mp4_path.exists():
                     mp4_path.unlink()
-                if wav_path.exists():
-                    wav_path.unlink()
                 # Keep frames for visual reference
             except Exception as cleanup_error:
                 logger.warning(f"Cleanup failed for {video_id}: {cleanup_error}")
@@ -674,8 +663,6 @@ Return only the JSON object above, filled with actual data from the analysis:"""
         # Generate collective insights
         try:
             if SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys:
-                client = get_smart_client()
-                
                 # Prepare detailed summary data for LLM analysis
                 video_summaries = []
                 total_duration = 0
@@ -801,7 +788,7 @@ Return only the JSON object above, filled with actual data from the analysis:"""
                         else " You provide detailed content strategy analysis and performance insights."
                     ) + " Provide thorough, detailed analytical insights with specific examples and data-driven observations. Focus on what IS rather than what SHOULD BE. Be comprehensive but focused on analysis, not recommendations."
                     
-                    collective_analysis = client.chat(
+                    collective_analysis = cached_chat(
                         [
                             {"role": "system", "content": system_prompt},
                             {"role": "user", "content": collective_prompt},
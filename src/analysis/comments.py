@@ -28,6 +28,9 @@ from src.analysis.sentiment import sentiment_scores
 
 logger = logging.getLogger(__name__)
 
+# Retries (with exponential backoff) for transient 5xx / rate-limit responses
+NUM_RETRIES = 3
+
 
 # ---------------------------------------------------------------------------
 # Fetch helpers (copied from old analysis.core)
@@ -55,7 +58,7 @@ def fetch_comments(
             textFormat="plainText",
         )
         try:
-            resp = req.execute()
+            resp = req.execute(num_retries=NUM_RETRIES)
         except Exception as exc:  # pragma: no cover
             # Handle common 403 error patterns gracefully without spamming the logs
             if order == "relevance" and "insufficientPermissions" in str(exc):
@@ -7,29 +7,83 @@ can be tweaked via environment variables without changing code.
 from __future__ import annotations
 
 import logging
+import threading
 from functools import lru_cache
-from typing import List, Sequence
+from typing import Dict, List, Sequence, Tuple
 
-from transformers import pipeline  # type: ignore
+import torch
+from transformers import AutoModelForSequenceClassification, AutoTokenizer  # type: ignore
 
 from src.config.settings import SETTINGS
 
 logger = logging.getLogger(__name__)
 
-# Maximum items per pipeline batch – HF will chunk internally anyway but we
-# keep this modest to limit memory usage when very large comment lists are
-# analysed.
-BATCH_SIZE = 32
+# Forward passes are sized by padded token count rather than item count.
+# Texts are scored in length order so each batch pads little: short comments
+# go through up to MAX_BATCH_ITEMS at a time, long ones in smaller batches,
+# which keeps memory usage modest when very large comment lists are analysed.
+MAX_BATCH_ITEMS = 128
+MAX_BATCH_TOKENS = 8192
+
+# Signed polarity per label of the common 1-5 star scheme; any other label
+# scores 0.
+_STAR_POLARITY = (
+    ("1 star", -1.0),
+    ("2 stars", -0.5),
+    ("3 stars", 0.0),
+    ("4 stars", 0.5),
+    ("5 stars", 1.0),
+)
+
+
+def _label_polarity(label: str) -> float:
+    label = label.lower()
+    for stars, polarity in _STAR_POLARITY:
+        if stars in label:
+            return polarity
+    return 0.0
+
+
+# Held while fetching the model: comment and transcript sentiment run on
+# separate threads, and concurrent first calls would otherwise each miss the
+# lru_cache and load their own copy.
+_MODEL_LOCK = threading.Lock()
 
 
 @lru_cache(maxsize=2)
-def _hf_pipeline(model_id: str | None = None):
-    """Lazy-load and cache the HuggingFace *sentiment-analysis* pipeline."""
+def _load_model(model_id: str | None = None) -> Tuple[object, object, torch.Tensor, torch.device]:
+    """Lazy-load and cache the tokenizer and sequence-classification model.
+
+    Returns ``(tokenizer, model, polarity, device)`` where *polarity* holds
+    the signed weight of each output label, indexed by label id. The model
+    runs in FP16 on the GPU when CUDA is available, otherwise on the CPU.
+    """
 
     if model_id is None:
         model_id = SETTINGS.sentiment_model
     logger.info("Loading sentiment model: %s", model_id)
-    return pipeline("sentiment-analysis", model=model_id, tokenizer=model_id, device=-1)  # type: ignore
+    tokenizer = AutoTokenizer.from_pretrained(model_id)
+    model = AutoModelForSequenceClassification.from_pretrained(model_id).eval()
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    if device.type == "cuda":
+        model = model.to(device).half()
+    elif SETTINGS.sentiment_quantize:
+        # int8 weights for the linear layers: roughly 2-4x faster matmuls on
+        # CPU and a quarter of the memory, at a negligible accuracy cost.
+        try:
+            model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        except Exception as exc:  # pragma: no cover - no quantised CPU backend
+            logger.warning("Could not quantise sentiment model, using FP32: %s", exc)
+    if SETTINGS.sentiment_compile:
+        # Attention already runs through fused SDPA kernels; compiling also
+        # fuses the matmul/bias/activation chains. Shapes vary per batch.
+        try:
+            model = torch.compile(model, dynamic=True)
+        except Exception as exc:  # pragma: no cover - torch build without dynamo support
+            logger.warning("Could not compile sentiment model, running eagerly: %s", exc)
+    id2label = model.config.id2label
+    polarity = torch.tensor([_label_polarity(id2label[i]) for i in range(model.config.num_labels)], device=device)
+    return tokenizer, model, polarity, device
 
 
 # ---------------------------------------------------------------------------
@@ -38,33 +92,57 @@ def _hf_pipeline(model_id: str | None = None):
 
 
 def sentiment_scores(texts: Sequence[str]) -> List[float]:
-    """Return polarity scores in the range [-1, 1] for *texts*."""
+    """Return polarity scores in the range [-1, 1] for *texts*.
+
+    Each score is the polarity of the predicted label scaled by its
+    probability. Duplicate texts are scored once; the rest are tokenised once,
+    then scored in length-sorted batches with a single forward pass each,
+    without the per-item overhead of a ``transformers.pipeline``.
+    """
 
     if not texts:
         return []
 
-    pipe = _hf_pipeline()
-    results = pipe(list(texts), batch_size=BATCH_SIZE, truncation=True)
-
-    scores: List[float] = []
-    for res in results:
-        label = res["label"].lower()
-        conf = float(res["score"])
-        # Map label → signed score according to common 1-5 star scheme.
-        if "1 star" in label:
-            scores.append(-1.0 * conf)
-        elif "2 stars" in label:
-            scores.append(-0.5 * conf)
-        elif "3 stars" in label:
-            scores.append(0.0)
-        elif "4 stars" in label:
-            scores.append(0.5 * conf)
-        elif "5 stars" in label:
-            scores.append(1.0 * conf)
-        else:
-            scores.append(0.0)
-
-    return scores
+    # Comment sections repeat themselves ("First!", emoji-only replies,
+    # copy-paste spam), so each distinct whitespace-normalised text is scored
+    # once and the score shared by its duplicates.
+    unique: Dict[str, int] = {}
+    slots = [unique.setdefault(" ".join(text.split()), len(unique)) for text in texts]
+
+    with _MODEL_LOCK:
+        tokenizer, model, polarity, device = _load_model()
+        # A fast tokenizer switches its truncation state on each call, so
+        # concurrent callers must not encode through it at the same time
+        encoded = tokenizer(list(unique), truncation=True)
+    lengths = [len(ids) for ids in encoded["input_ids"]]
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+
+    scores: List[float] = [0.0] * len(lengths)
+    with torch.inference_mode():
+        start = 0
+        while start < len(order):
+            # Lengths ascend, so the last text added sets the padded width
+            stop = start + 1
+            while (
+                stop < len(order)
+                and stop - start < MAX_BATCH_ITEMS
+                and (stop - start + 1) * lengths[order[stop]] <= MAX_BATCH_TOKENS
+            ):
+                stop += 1
+            rows = order[start:stop]
+            batch = tokenizer.pad(
+                {key: [encoded[key][i] for i in rows] for key in encoded.keys()}, return_tensors="pt"
+            )
+            if device.type == "cuda":
+                # Pinned host memory lets the copy run asynchronously
+                batch = {key: value.pin_memory().to(device, non_blocking=True) for key, value in batch.items()}
+            probs = model(**batch).logits.float().softmax(dim=-1)
+            conf, label_ids = probs.max(dim=-1)
+            for i, score in zip(rows, (polarity[label_ids] * conf).tolist()):
+                scores[i] = score
+            start = stop
+
+    return [scores[i] for i in slots]
 
 
 __all__ = ["sentiment_scores"] 
\ No newline at end of file
@@ -3,18 +3,22 @@
 Public API
 ==========
 extract_frames()            – thin passthrough to video.extract_frames
+extract_frame_images()      – like extract_frames() but returns JPEG bytes
+                             without writing frames to disk.
 analyze_frames()            – extract selected frames *and* run detection
                              in one call; saves detections JSON if requested.
 """
 
 from __future__ import annotations
 
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 
 from src.config.settings import SETTINGS, PipelineSettings
+from src.helpers.json_io import write_json
 import os
 import re, subprocess, shutil, urllib.parse
 from typing import Optional
@@ -26,13 +30,15 @@ logger = logging.getLogger(__name__)
 # Duration and auto-quality helpers
 # ---------------------------------------------------------------------------
 
+_ISO_DURATION_REGEX = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+
+
 def parse_iso_duration_to_minutes(iso_duration: str) -> int:
     """Convert ISO-8601 duration (PT#H#M#S) to total minutes."""
     if not iso_duration:
         return 0
     
-    pattern = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
-    match = pattern.match(iso_duration)
+    match = _ISO_DURATION_REGEX.match(iso_duration)
     if not match:
         return 0
     
@@ -96,6 +102,7 @@ def extract_frames(
 # --- ID helper & download -------------------------------------------------
 _YT_REGEX = re.compile(r"(?:v=|youtu\.be/|/shorts/)([A-Za-z0-9_-]{11})")
 
+@lru_cache(maxsize=4096)
 def extract_video_id(url: str) -> str:
     m = _YT_REGEX.search(url)
     if m:
@@ -254,7 +261,7 @@ def analyze_frames(
         save_json_path = Path(out_dir) / "frames.json"
 
     save_json_path.parent.mkdir(parents=True, exist_ok=True)
-    save_json_path.write_text(json.dumps(detections, indent=2, ensure_ascii=False))
+    write_json(save_json_path, detections)
     logger.info("Saved %d frame entries to %s", len(detections), save_json_path)
 
     return detections
@@ -262,6 +269,91 @@ def analyze_frames(
 
 # ffmpeg-based frame extraction (copied from former video.core)
 
+# Let ffmpeg decode on NVDEC/VAAPI/QuickSync/VideoToolbox when available; it
+# falls back to software decoding otherwise.
+_HWACCEL_ARGS = ("-hwaccel", "auto")
+# Concurrent ffmpeg seeks per video. Kept small because callers already run
+# several videos (and a Whisper transcription for each) at once.
+_GRAB_WORKERS = 4
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_available() -> bool:
+    """Probe PATH for ffmpeg once per process instead of once per video."""
+    return shutil.which("ffmpeg") is not None
+
+
+def _ffmpeg_grab_frame(video_file: Path, timestamp: float, out_path: Path | None = None) -> bytes | None:
+    """Grab the frame at *timestamp* seconds as JPEG.
+
+    Written to *out_path* when given, otherwise streamed over a pipe and
+    returned as bytes. A failed grab (a seek past the end, a hwaccel init
+    error) is logged and yields ``None`` and no file, so one bad frame does
+    not sink the rest of the video.
+    """
+    cmd = [
+        "ffmpeg",
+        "-y",
+        *_HWACCEL_ARGS,
+        "-ss",
+        str(timestamp),
+        "-i",
+        str(video_file),
+        "-frames:v",
+        "1",
+        "-q:v",
+        "2",
+    ]
+    try:
+        if out_path is not None:
+            cmd.append(str(out_path))
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return None
+        cmd += ["-f", "image2pipe", "-c:v", "mjpeg", "pipe:1"]
+        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        return result.stdout or None
+    except subprocess.CalledProcessError as e:
+        logger.debug("ffmpeg could not grab frame at %.1fs from %s: %s", timestamp, video_file, e)
+        if out_path is not None:
+            out_path.unlink(missing_ok=True)
+        return None
+
+
+def _sample_points(every_sec: int, limit: int) -> List[float]:
+    # The fps filter emits the frame in the middle of each interval, so the
+    # seeking paths sample the same points
+    return [(idx + 0.5) * every_sec for idx in range(limit)]
+
+
+def extract_frame_images(
+    video_file: Path | str,
+    *,
+    every_sec: int | None = None,
+    limit: int,
+    settings: PipelineSettings = SETTINGS,
+) -> List[Tuple[float, bytes]]:
+    """Return up to *limit* frames as ``(timestamp_sec, jpeg_bytes)`` tuples.
+
+    Same sampling as :func:`extract_frames`, but frames are piped straight
+    out of ffmpeg for callers that only hand them to a vision model.
+    """
+
+    if every_sec is None:
+        every_sec = settings.frame_interval_sec
+
+    if not _ffmpeg_available():
+        logger.warning("ffmpeg not found – skipping frame extraction.")
+        return []
+
+    logger.info("Extracting %d frames every %ds from %s", limit, every_sec, video_file)
+    video_file = Path(video_file)
+    with ThreadPoolExecutor(max_workers=max(1, min(limit, _GRAB_WORKERS))) as pool:
+        images = list(pool.map(lambda ts: _ffmpeg_grab_frame(video_file, ts), _sample_points(every_sec, limit)))
+
+    # Seeks past the end of the video and failed grabs return nothing
+    return [(idx * every_sec, image) for idx, image in enumerate(images) if image is not None]
+
+
 def _ffmpeg_extract_frames(
     video_file: Path | str,
     out_dir: Path | str,
@@ -272,34 +364,49 @@ def _ffmpeg_extract_frames(
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    if shutil.which("ffmpeg") is None:
+    if not _ffmpeg_available():
         logger.warning("ffmpeg not found – skipping frame extraction.")
         return []
 
-    pattern = out_dir / "frame_%06d.jpg"
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        str(video_file),
-        "-vf",
-        f"fps=1/{every_sec}",
-        "-q:v",
-        "2",
-        str(pattern),
-    ]
     logger.info("Extracting frames every %ds from %s", every_sec, video_file)
-    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if limit is not None:
+        # A bounded number of frames: seek straight to each one so ffmpeg only
+        # decodes from the preceding keyframe rather than the whole stretch of
+        # video in between. Seeks past the end of the video and failed grabs
+        # produce no file.
+        with ThreadPoolExecutor(max_workers=max(1, min(limit, _GRAB_WORKERS))) as pool:
+            list(pool.map(
+                lambda item: _ffmpeg_grab_frame(video_file, item[1], out_dir / f"frame_{item[0] + 1:06d}.jpg"),
+                enumerate(_sample_points(every_sec, limit)),
+            ))
+    else:
+        cmd = [
+            "ffmpeg",
+            "-y",
+            *_HWACCEL_ARGS,
+            "-i",
+            str(video_file),
+            "-vf",
+            f"fps=1/{every_sec}",
+            "-q:v",
+            "2",
+            str(out_dir / "frame_%06d.jpg"),
+        ]
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-    frames = sorted(out_dir.glob("frame_*.jpg"))
+    # Zero-padded names sort in frame order; only build Paths for those kept.
+    # The timestamp comes from the frame number, since grabs may be missing.
+    with os.scandir(out_dir) as entries:
+        names = sorted(e.name for e in entries if e.name.startswith("frame_") and e.name.endswith(".jpg"))
     if limit is not None:
-        frames = frames[:limit]
+        names = names[:limit]
 
-    return [(idx * every_sec, p) for idx, p in enumerate(frames)]
+    return [((int(name[6:-4]) - 1) * every_sec, out_dir / name) for name in names]
 
 
 __all__ = [
     "extract_frames",
+    "extract_frame_images",
     "analyze_frames",
     "extract_video_id",
     "download_video",
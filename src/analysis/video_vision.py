@@ -1,7 +1,7 @@
 """Vision LLM helper using OpenRouter multimodal model.
 
 summarise_frames(frames) -> returns LLM summary of supplied JPEG frames.
-Each *frame* is a tuple (timestamp_sec, Path).
+Each *frame* is a tuple (timestamp_sec, Path) or (timestamp_sec, JPEG bytes).
 
 Requires OPENROUTER_API_KEY in environment and a model that supports images
 (default: google/gemini-pro-vision).
@@ -10,23 +10,94 @@ Requires OPENROUTER_API_KEY in environment and a model that supports images
 from __future__ import annotations
 
 import base64
+import hashlib
+import io
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
-from src.llms import get_client
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - optional: frames are sent full-size
+    Image = None
+
+from src.llms import get_client, cache_get, cache_put
 from src.config.settings import SETTINGS
 from src.prompts.vision_analysis import get_frame_analysis_prompt
 
 logger = logging.getLogger(__name__)
 
+CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "cache" / "vision"
+_CACHE_VERSION = b"v1"
+# Requests use detail="low", so the model sees at most 512px anyway
+_MAX_FRAME_SIDE = 512
+# Threads for reading and re-encoding frames; file reads, JPEG decoding and
+# base64 encoding all release the GIL.
+_FRAME_WORKERS = 8
+
 
-def _b64(img_path: Path) -> str:
-    return base64.b64encode(img_path.read_bytes()).decode()
+def _downscale_jpeg(data: bytes) -> bytes:
+    """Shrink a frame to fit _MAX_FRAME_SIDE before upload (needs Pillow)."""
+
+    if Image is None:
+        return data
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if max(img.size) <= _MAX_FRAME_SIDE:
+                return data
+            img.thumbnail((_MAX_FRAME_SIDE, _MAX_FRAME_SIDE))
+            buf = io.BytesIO()
+            img.convert("RGB").save(buf, "JPEG", quality=70)
+    except OSError as exc:
+        logger.debug("Could not downscale frame: %s", exc)
+        return data
+    return buf.getvalue()
+
+
+def _frame_data_url(data: bytes) -> str:
+    """Return a frame as a ``data:`` URL, built on the encoding worker thread.
+
+    The prefix is joined to the base64 bytes before the single ASCII decode,
+    so the URL string is materialised once.
+    """
+
+    return (b"data:image/jpeg;base64," + base64.b64encode(_downscale_jpeg(data))).decode("ascii")
+
+
+def _frames_cache_path(
+    frame_bytes: List[bytes], timestamps: List[float], prompt: str, model: str | None
+) -> Path:
+    """Return the cache file for one vision request.
+
+    Keyed by SHA-256 of each frame's bytes plus the prompt, model and
+    timestamps. Every field is length-prefixed before hashing so that
+    different field boundaries can never produce the same digest. Entries
+    are read and written with the shared LLM cache helpers, so they expire
+    like chat responses.
+    """
+
+    digest = hashlib.sha256()
+    fields = [
+        _CACHE_VERSION,
+        (model or "").encode(),
+        prompt.encode(),
+        json.dumps(timestamps).encode(),
+        *(hashlib.sha256(data).digest() for data in frame_bytes),
+    ]
+    for field in fields:
+        digest.update(len(field).to_bytes(8, "big"))
+        digest.update(field)
+    return CACHE_DIR / f"{digest.hexdigest()}.json"
+
+
+def _frame_bytes(frame: Path | bytes) -> bytes:
+    return frame if isinstance(frame, bytes) else frame.read_bytes()
 
 
 def summarise_frames(
-    frames: List[Tuple[float, Path]],
+    frames: List[Tuple[float, Path | bytes]],
     *,
     prompt: str | None = None,
     model: str | None = None,
@@ -49,13 +120,23 @@ def summarise_frames(
     # Take at most 16 frames (Gemini vision limit)
     frames = frames[:16]
 
+    with ThreadPoolExecutor(max_workers=min(_FRAME_WORKERS, len(frames))) as pool:
+        frame_bytes = list(pool.map(_frame_bytes, [img for _, img in frames]))
+    cache_path = _frames_cache_path(frame_bytes, [ts for ts, _ in frames], prompt, model)
+    cached = cache_get(cache_path)
+    if cached is not None:
+        return cached
+
+    with ThreadPoolExecutor(max_workers=min(_FRAME_WORKERS, len(frames))) as pool:
+        data_urls = list(pool.map(_frame_data_url, frame_bytes))
+
     content = [{"type": "text", "text": prompt}]
-    for ts, img in frames:
+    for (ts, _), data_url in zip(frames, data_urls):
         content.append(
             {
                 "type": "image_url",
                 "image_url": {
-                    "url": f"data:image/jpeg;base64,{_b64(img)}",
+                    "url": data_url,
                     "detail": "low",
                 },
             }  # type: ignore[arg-type]
@@ -72,10 +153,13 @@ def summarise_frames(
             temperature=0.2,
             max_tokens=256,
         )
-        return reply
     except Exception as e:
         logger.error("Vision analysis failed with all providers: %s", e)
         raise
 
+    if reply:
+        cache_put(cache_path, reply)
+    return reply
+
 
 __all__ = ["summarise_frames"] 
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Analytics helper functions for unified public + OAuth channel analysis."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from googleapiclient.discovery import Resource  # type: ignore
 
@@ -38,19 +39,26 @@ def get_full_channel_analytics(
     from src.youtube.public import get_comprehensive_channel_data
     from src.youtube.analytics import get_comprehensive_channel_analytics
     
-    # Get public data (all uploads, basic stats, etc.)
-    public_data = get_comprehensive_channel_data(public_service, channel_id)
-    
-    # Get OAuth-only extras if available
-    oauth_data = None
-    if oauth_service:
+    def _oauth_extras() -> Optional[Dict[str, Any]]:
         try:
-            oauth_data = get_comprehensive_channel_analytics(
+            return get_comprehensive_channel_analytics(
                 oauth_service, channel_id, days_back=days_back
             )
         except Exception as e:
             print(f"OAuth analytics failed: {e}")
-            oauth_data = {"error": str(e)}
+            return {"error": str(e)}
+    
+    # The public and OAuth requests are independent and use separate
+    # services, so the OAuth extras (if available) are fetched alongside
+    oauth_data = None
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        oauth_future = pool.submit(_oauth_extras) if oauth_service else None
+        
+        # Get public data (all uploads, basic stats, etc.)
+        public_data = get_comprehensive_channel_data(public_service, channel_id)
+        
+        if oauth_future is not None:
+            oauth_data = oauth_future.result()
     
     # Merge data
     result = {**public_data}
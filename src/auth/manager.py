@@ -10,12 +10,15 @@ from __future__ import annotations
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict, Any
 
 from google.oauth2.credentials import Credentials  # type: ignore
 from src.youtube.oauth import get_service as get_oauth_service
+from src.helpers.json_io import read_json as _read_json
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +37,10 @@ TOKENS_DIR.mkdir(parents=True, exist_ok=True)
 # project root). Callers can override this path if they wish.
 DEFAULT_CLIENT_SECRET = ROOT_DIR / "client_secret.json"
 
+# Whether a token file is an authorised-user credential, keyed by
+# (path, mtime_ns, size) so an unchanged file is only parsed once.
+_TOKEN_VALID_CACHE: Dict[Tuple[str, int, int], bool] = {}
+
 
 # ---------------------------------------------------------------------------
 # Environment-based OAuth configuration
@@ -125,42 +132,77 @@ def list_token_files() -> List[Path]:
 
     We exclude files that are not authorised-user credential JSONs (e.g. raw
     `client_secret.json` files uploaded by mistake) by ensuring the JSON
-    payload includes a ``refresh_token`` key.
+    payload includes a ``refresh_token`` key. The verdict is cached per file
+    modification time and size, so repeat calls only ``stat`` unchanged files.
     """
 
-    candidate_files = sorted(TOKENS_DIR.glob("*.json"))
+    try:
+        with os.scandir(TOKENS_DIR) as it:
+            candidate_entries = sorted(
+                (entry for entry in it if entry.name.endswith(".json")), key=lambda entry: entry.name
+            )
+    except OSError:
+        return []
     valid_files: List[Path] = []
 
-    for path in candidate_files:
+    for entry in candidate_entries:
         # Skip temporary files
-        if path.name.startswith("_temp"):
+        if entry.name.startswith("_temp"):
             continue
             
         try:
-            data = json.loads(path.read_text())
-            # An authorised-user credential always contains these fields
-            if "refresh_token" in data and "client_id" in data:
-                valid_files.append(path)
-        except Exception:
-            # Skip unreadable or malformed JSON files silently – they will be
-            # surfaced later if needed during individual credential loading.
+            if not entry.is_file():
+                continue
+            st = entry.stat()
+        except OSError:
             continue
+        key = (entry.path, st.st_mtime_ns, st.st_size)
+        valid = _TOKEN_VALID_CACHE.get(key)
+        if valid is None:
+            try:
+                data = _read_json(Path(entry.path))
+                # An authorised-user credential always contains these fields
+                valid = "refresh_token" in data and "client_id" in data
+            except Exception:
+                # Skip unreadable or malformed JSON files silently – they will be
+                # surfaced later if needed during individual credential loading.
+                valid = False
+            _TOKEN_VALID_CACHE[key] = valid
+        if valid:
+            valid_files.append(Path(entry.path))
 
     return valid_files
 
 
+def _forget_token_file(path: Path) -> None:
+    """Drop cached validity entries for *path* after it is replaced or removed."""
+    for key in [key for key in _TOKEN_VALID_CACHE if key[0] == str(path)]:
+        _TOKEN_VALID_CACHE.pop(key, None)
+
+
 def validate_client_secret(client_secret_path: Path) -> Dict[str, Any]:
     """Validate a client secret JSON file and return metadata.
     
+    The result is cached per file modification time and size, so UI reruns
+    do not re-read an unchanged secret.
+
     Returns:
         Dict with 'valid', 'error', 'project_id', 'client_id' keys
     """
     try:
-        if not client_secret_path.exists():
-            return {"valid": False, "error": "File does not exist"}
-        
-        with open(client_secret_path) as f:
-            data = json.load(f)
+        st = client_secret_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return {"valid": False, "error": "File does not exist"}
+    except OSError as e:
+        return {"valid": False, "error": f"Validation error: {str(e)}"}
+    return dict(_validate_client_secret(str(client_secret_path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=32)
+def _validate_client_secret(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Validate *path*; *mtime_ns* and *size* only key the cache."""
+    try:
+        data = _read_json(Path(path))
         
         # Check for required OAuth structure
         if "web" not in data and "installed" not in data:
@@ -180,7 +222,7 @@ def validate_client_secret(client_secret_path: Path) -> Dict[str, Any]:
             "client_id": client_id,
             "type": "web" if "web" in data else "installed"
         }
-    except json.JSONDecodeError:
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
         return {"valid": False, "error": "Invalid JSON format"}
     except Exception as e:
         return {"valid": False, "error": f"Validation error: {str(e)}"}
@@ -253,6 +295,18 @@ def get_creator_details(token_file: Path) -> Dict[str, Any]:
         }
 
 
+def get_all_creator_details(token_files: List[Path], max_workers: int = 8) -> List[Dict[str, Any]]:
+    """Return :func:`get_creator_details` for each of *token_files*, in order.
+
+    Each lookup is a Google API round-trip, so they run on a thread pool;
+    every worker thread builds its own OAuth service.
+    """
+    if len(token_files) <= 1:
+        return [get_creator_details(tf) for tf in token_files]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(token_files))) as pool:
+        return list(pool.map(get_creator_details, token_files))
+
+
 def channel_info_from_token(
     token_file: Path, *, client_secret_file: Optional[Path] = None
 ) -> Tuple[str, str]:
@@ -317,6 +371,7 @@ def onboard_creator(
         final_token_path = tokens_dir / f"{channel_id}.json"
         # Overwrite existing credentials atomically (replace is atomic on POSIX)
         temp_token.replace(final_token_path)
+        _forget_token_file(final_token_path)
         logger.info("Onboarded channel '%s' (%s)", channel_title, channel_id)
         return final_token_path, channel_id, channel_title
     except Exception as exc:  # pylint: disable=broad-except
@@ -336,6 +391,7 @@ def remove_creator(channel_id: str, *, tokens_dir: Optional[Path] = None) -> boo
     token_file = tokens_dir / f"{channel_id}.json"
     if token_file.exists():
         token_file.unlink()
+        _forget_token_file(token_file)
         logger.info("Removed credentials for channel %s", channel_id)
         return True
 
@@ -3,6 +3,13 @@
 Only parameters that the current codebase still uses are kept.
 • FRAME_INTERVAL_SEC  – seconds between extracted frames in video analysis.
 • SENTIMENT_MODEL     – HuggingFace model id for sentiment scoring.
+• SENTIMENT_QUANTIZE  – "0" keeps the sentiment model in FP32 instead of int8.
+• SENTIMENT_COMPILE   – "1" runs the sentiment model through torch.compile.
+• WHISPER_MODEL       – Whisper checkpoint ("auto" picks one per device).
+• WHISPER_DEVICE      – "auto", "cpu" or "cuda" for Whisper transcription.
+• VIDEO_PARALLELISM   – videos processed concurrently per channel. Each one
+                        holds its decoded audio in memory and runs its own
+                        Whisper transcription and ffmpeg frame grabs.
 • Multiple API keys per provider for automatic rotation when rate limits are hit.
 """
 
@@ -10,7 +17,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
 
 from dotenv import load_dotenv  # type: ignore
 
@@ -18,25 +25,30 @@ from dotenv import load_dotenv  # type: ignore
 load_dotenv()
 
 
-def _get_multiple_keys(prefix: str) -> List[str]:
-    """Extract multiple API keys from environment variables with numbered suffixes."""
-    keys = []
-    
-    # First try the base key name (for backward compatibility)
-    base_key = os.getenv(prefix)
-    if base_key:
-        keys.append(base_key)
-    
-    # Then try numbered keys (1, 2, 3, ...)
-    counter = 1
-    while True:
-        key = os.getenv(f"{prefix}_{counter}")
-        if key:
-            keys.append(key)
+def _get_multiple_keys(*prefixes: str) -> Dict[str, List[str]]:
+    """Extract multiple API keys per prefix from environment variables with numbered suffixes.
+
+    The environment is scanned once for all *prefixes*. For each prefix the
+    base key name comes first (for backward compatibility), followed by
+    ``PREFIX_1``, ``PREFIX_2``, ... up to the first missing or empty one.
+    """
+    found: Dict[str, Dict[int, str]] = {prefix: {} for prefix in prefixes}
+    for name, value in os.environ.items():
+        for prefix in prefixes:
+            if name == prefix:
+                found[prefix][0] = value
+            elif name.startswith(prefix) and name[len(prefix)] == "_":
+                suffix = name[len(prefix) + 1:]
+                if suffix.isascii() and suffix.isdigit() and suffix[0] != "0":
+                    found[prefix][int(suffix)] = value
+
+    keys: Dict[str, List[str]] = {}
+    for prefix, by_index in found.items():
+        keys[prefix] = [by_index[0]] if by_index.get(0) else []
+        counter = 1
+        while by_index.get(counter):
+            keys[prefix].append(by_index[counter])
             counter += 1
-        else:
-            break
-    
     return keys
 
 
@@ -51,6 +63,23 @@ class PipelineSettings:
     sentiment_model: str = os.getenv(
         "SENTIMENT_MODEL", "nlptown/bert-base-multilingual-uncased-sentiment"
     )
+    # Dynamic int8 quantisation of the model's linear layers (CPU inference).
+    sentiment_quantize: bool = os.getenv("SENTIMENT_QUANTIZE", "1").lower() not in ("0", "false", "no")
+    # Fused kernels are ~20% faster per batch but the first call compiles for
+    # tens of seconds, so this only pays off for long-running batch jobs.
+    sentiment_compile: bool = os.getenv("SENTIMENT_COMPILE", "0").lower() in ("1", "true", "yes")
+
+    # --- Whisper transcription ------------------------------------------
+    # "auto" model = distil-large-v3 on GPU, base on CPU.
+    # "auto" device uses CUDA when CTranslate2 sees a GPU, otherwise the CPU.
+    whisper_model: str = os.getenv("WHISPER_MODEL", "auto")
+    whisper_device: str = os.getenv("WHISPER_DEVICE", "auto")
+
+    # --- Channel processing ----------------------------------------------
+    # Every concurrent video keeps a fully decoded audio track in memory
+    # (~230 MB per hour) and runs an all-core Whisper pass plus a small pool
+    # of ffmpeg frame grabs, so raise this with RAM and cores in mind.
+    video_parallelism: int = int(os.getenv("VIDEO_PARALLELISM", "4"))
 
     # --- Multiple LLM provider keys for rotation -------------------------
     openrouter_api_keys: List[str] = None  # Will be populated in __post_init__
@@ -76,9 +105,10 @@ class PipelineSettings:
     def __post_init__(self):
         """Load multiple keys after initialization."""
         # Use object.__setattr__ because dataclass is frozen
-        object.__setattr__(self, 'openrouter_api_keys', _get_multiple_keys("OPENROUTER_API_KEY"))
-        object.__setattr__(self, 'groq_api_keys', _get_multiple_keys("GROQ_API_KEY"))
-        object.__setattr__(self, 'gemini_api_keys', _get_multiple_keys("GEMINI_API_KEY"))
+        keys = _get_multiple_keys("OPENROUTER_API_KEY", "GROQ_API_KEY", "GEMINI_API_KEY")
+        object.__setattr__(self, 'openrouter_api_keys', keys["OPENROUTER_API_KEY"])
+        object.__setattr__(self, 'groq_api_keys', keys["GROQ_API_KEY"])
+        object.__setattr__(self, 'gemini_api_keys', keys["GEMINI_API_KEY"])
         
         # Set backward compatibility single keys (first key if available)
         object.__setattr__(self, 'openrouter_api_key', self.openrouter_api_keys[0] if self.openrouter_api_keys else None)
@@ -96,6 +126,11 @@ def update_from_kwargs(**overrides):  # type: ignore[override]
     return PipelineSettings(
         frame_interval_sec=overrides.get("frame_interval_sec", SETTINGS.frame_interval_sec),
         sentiment_model=overrides.get("sentiment_model", SETTINGS.sentiment_model),
+        sentiment_quantize=overrides.get("sentiment_quantize", SETTINGS.sentiment_quantize),
+        sentiment_compile=overrides.get("sentiment_compile", SETTINGS.sentiment_compile),
+        whisper_model=overrides.get("whisper_model", SETTINGS.whisper_model),
+        whisper_device=overrides.get("whisper_device", SETTINGS.whisper_device),
+        video_parallelism=overrides.get("video_parallelism", SETTINGS.video_parallelism),
         openrouter_chat_model=overrides.get("openrouter_chat_model", SETTINGS.openrouter_chat_model),
         groq_chat_model=overrides.get("groq_chat_model", SETTINGS.groq_chat_model),
         gemini_chat_model=overrides.get("gemini_chat_model", SETTINGS.gemini_chat_model),
@@ -12,6 +12,7 @@ from typing import List, Tuple, Any, Dict, Optional
 from src.auth.manager import (
     list_token_files as _list_token_files_original,
     get_creator_details as _get_creator_details_original,
+    get_all_creator_details as _get_all_creator_details_original,
     refresh_creator_token as _refresh_creator_token_original,
     remove_creator as _remove_creator_original,
     onboard_creator as _onboard_creator_original,
@@ -34,6 +35,11 @@ def get_creator_details(token_file: Path) -> Dict[str, Any]:
     return _get_creator_details_original(token_file)
 
 
+def get_all_creator_details(token_files: List[Path]) -> List[Dict[str, Any]]:
+    """Return status and channel stats for several credential files concurrently."""
+    return _get_all_creator_details_original(token_files)
+
+
 def refresh_creator_token(channel_id: str) -> bool:
     """Attempt to refresh an expired token for the given channel ID."""
     return _refresh_creator_token_original(channel_id)
@@ -0,0 +1,51 @@
+"""JSON file helpers that use orjson when it is installed.
+
+orjson is an optional speed-up: it parses from bytes without decoding to
+``str`` first and serialises several times faster than the stdlib. Without
+it the stdlib ``json`` module produces equivalent files.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+
+def read_json(path: Path | str) -> Any:
+    """Parse the JSON file at *path* from bytes."""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def write_json(
+    path: Path | str,
+    data: Any,
+    *,
+    indent: bool = True,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    """Write *data* to *path* as UTF-8 JSON, two-space indented unless *indent* is false.
+
+    orjson encodes dataclasses and numpy values natively; *default* handles
+    anything else (and is what the stdlib fallback relies on for those).
+    """
+    path = Path(path)
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        path.write_bytes(orjson.dumps(data, default=default, option=option))
+    else:
+        path.write_text(
+            json.dumps(data, indent=2 if indent else None, ensure_ascii=False, default=default),
+            encoding="utf-8",
+        )
+
+
+__all__ = ["read_json", "write_json"]
@@ -5,9 +5,9 @@ single YouTube video, using the same detailed approach as channel analytics.
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
 
@@ -16,12 +16,13 @@ from src.analysis import video_frames as vf_mod
 from src.analysis import video_vision as vision_mod
 from src.analysis import comments as comments_mod
 from src.analysis.video_frames import download_video, get_video_duration_from_url, auto_select_video_quality
-from src.analysis.audio import extract_audio, transcribe as transcribe_audio
+from src.analysis.audio import load_audio, transcribe as transcribe_audio
 from src.config.settings import SETTINGS
 from src.youtube import public as yt_public
 from src.youtube.oauth import get_service as get_oauth_service
 from src.auth.manager import list_token_files, TOKENS_DIR
-from src.llms import get_smart_client
+from src.llms import cached_chat
+from src.helpers.json_io import write_json
 from src.prompts.audio_analysis import get_enhanced_audio_analysis_prompt
 from src.prompts.video_summary import get_comprehensive_video_summary_prompt
 from src.prompts.comments_analysis import get_comments_summary_prompt
@@ -43,7 +44,7 @@ def _ensure_dir(path: Path) -> None:
 
 def _json_dump(data: Any, path: Path) -> None:
     _ensure_dir(path.parent)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+    write_json(path, data)
     logger.info("Saved JSON → %s", path)
 
 
@@ -186,113 +187,127 @@ def analyze_video(
 
     try:
         # ------------------------------------------------------------------
-        # 1. Download video (respect auto quality based on duration)
+        # Stage helpers. Comments only need the API, and the audio and vision
+        # stages only need the downloaded file, so they run on a small pool:
+        # comments overlap the download, audio overlaps frames + vision.
         # ------------------------------------------------------------------
-        url = f"https://www.youtube.com/watch?v={video_id}"
-        duration_minutes = get_video_duration_from_url(url)
-        quality = auto_select_video_quality(duration_minutes)
-        video_path = download_video(url, output_dir=output_base, quality=quality)
-
-        # ------------------------------------------------------------------
-        # 2. Enhanced Audio Analysis (same as channel analytics)
-        # ------------------------------------------------------------------
-        audio_wav = extract_audio(video_path, output_base / f"{video_id}.wav")
-        segments = transcribe_audio(audio_wav)
-        full_transcript = ""
-        
-        if segments:
-            full_transcript = "\n".join(s.get("text", "") for s in segments)
-            
-            # Enhanced audio analysis with LLM (same prompt as channel analytics)
+        def _analyse_audio(video_path: Path) -> Tuple[Optional[str], str]:
+            audio = load_audio(video_path)
+            segments = transcribe_audio(audio)
+            full_transcript = ""
             audio_analysis = None
-            if SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys:
-                try:
-                    client = get_smart_client()
-                    
-                    enhanced_audio_prompt = get_enhanced_audio_analysis_prompt(full_transcript)
 
-                    audio_analysis = client.chat(
-                        [{"role": "user", "content": enhanced_audio_prompt}],
-                        temperature=0.3,
-                        max_tokens=2000,
-                    )
-                except Exception as e:
-                    logger.warning(f"Enhanced audio analysis failed: {e}")
-                    audio_analysis = "Enhanced audio analysis failed"
+            if segments:
+                full_transcript = "\n".join(s.get("text", "") for s in segments)
 
-        # Save audio data with sentiment
-        audio_data = audio_mod.analyze_audio(audio_wav, out_path=output_base / f"{video_id}_audio.json")
-        result["audio_analysis"] = audio_analysis
+                # Enhanced audio analysis with LLM (same prompt as channel analytics)
+                if SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys:
+                    try:
+                        enhanced_audio_prompt = get_enhanced_audio_analysis_prompt(full_transcript)
 
-        # ------------------------------------------------------------------
-        # 3. Video frames → vision analysis (same as channel analytics)
-        # ------------------------------------------------------------------
-        frames_dir = output_base / "frames"
-        frames: List[Tuple[float, Path]] = vf_mod.extract_frames(
-            video_path,
-            frames_dir,
-            every_sec=frame_interval_sec or SETTINGS.frame_interval_sec,
-            limit=32,
-        )
-        _json_dump([{"timestamp": ts, "file": p.name} for ts, p in frames], output_base / f"{video_id}_frames.json")
+                        audio_analysis = cached_chat(
+                            [{"role": "user", "content": enhanced_audio_prompt}],
+                            temperature=0.3,
+                            max_tokens=2000,
+                        )
+                    except Exception as e:
+                        logger.warning(f"Enhanced audio analysis failed: {e}")
+                        audio_analysis = "Enhanced audio analysis failed"
+
+            # Save audio data with sentiment
+            audio_mod.analyze_audio(audio, out_path=output_base / f"{video_id}_audio.json")
+            return audio_analysis, full_transcript
+
+        def _analyse_frames(video_path: Path) -> Tuple[List[Tuple[float, Path]], str]:
+            frames_dir = output_base / "frames"
+            frames: List[Tuple[float, Path]] = vf_mod.extract_frames(
+                video_path,
+                frames_dir,
+                every_sec=frame_interval_sec or SETTINGS.frame_interval_sec,
+                limit=32,
+            )
+            _json_dump([{"timestamp": ts, "file": p.name} for ts, p in frames], output_base / f"{video_id}_frames.json")
 
-        vision_analysis = ""
-        if frames:
+            vision_analysis = ""
+            if frames:
+                try:
+                    vision_analysis = vision_mod.summarise_frames(frames)
+                    (output_base / f"{video_id}_vision_summary.md").write_text(vision_analysis, encoding="utf-8")
+                except Exception as e:
+                    logger.warning("Vision analysis failed: %s", e)
+                    vision_analysis = "Vision analysis failed"
+            return frames, vision_analysis
+
+        def _analyse_comments() -> Tuple[Optional[List[Dict[str, Any]]], str]:
             try:
-                vision_analysis = vision_mod.summarise_frames(frames)
-                (output_base / f"{video_id}_vision_summary.md").write_text(vision_analysis, encoding="utf-8")
+                comments_data = comments_mod.fetch_and_analyze(
+                    yt_service, video_id, out_path=output_base / f"{video_id}_comments.json"
+                )
             except Exception as e:
-                logger.warning("Vision analysis failed: %s", e)
-                vision_analysis = "Vision analysis failed"
+                logger.warning("Comment analysis failed: %s", e)
+                return None, f"Comment analysis failed: {e}"
 
-        result["video_analysis"] = vision_analysis
+            if not comments_data:
+                return comments_data, "No comments found or analysis failed"
 
-        # ------------------------------------------------------------------
-        # 4. Comments → fetch + sentiment (same as channel analytics)
-        # ------------------------------------------------------------------
-        try:
-            comments_data = comments_mod.fetch_and_analyze(
-                yt_service, video_id, out_path=output_base / f"{video_id}_comments.json"
-            )
-            
             # Enhanced comment analysis using centralized prompts
-            if comments_data:
-                try:
-                    # Generate comprehensive comments analysis using LLM
-                    if SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys:
-                        client = get_smart_client()
-                        comments_prompt = get_comments_summary_prompt(comments_data)
-                        
-                        comments_analysis = client.chat(
-                            [{"role": "user", "content": comments_prompt}],
-                            temperature=0.3,
-                            max_tokens=1000,
-                        )
-                        result["comments_analysis"] = comments_analysis
-                    else:
-                        # Fallback to basic summary if no LLM available
-                        sentiments = [c.get('sentiment', 0) for c in comments_data if 'sentiment' in c]
-                        avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
-                        positive_count = sum(1 for s in sentiments if s > 0.1)
-                        negative_count = sum(1 for s in sentiments if s < -0.1)
-                        
-                        comments_summary = f"""Comments Analysis Summary:
+            try:
+                # Generate comprehensive comments analysis using LLM
+                if SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys:
+                    comments_prompt = get_comments_summary_prompt(comments_data)
+
+                    comments_analysis = cached_chat(
+                        [{"role": "user", "content": comments_prompt}],
+                        temperature=0.3,
+                        max_tokens=1000,
+                    )
+                    return comments_data, comments_analysis
+
+                # Fallback to basic summary if no LLM available
+                sentiments = [c.get('sentiment', 0) for c in comments_data if 'sentiment' in c]
+                avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
+                positive_count = sum(1 for s in sentiments if s > 0.1)
+                negative_count = sum(1 for s in sentiments if s < -0.1)
+
+                comments_summary = f"""Comments Analysis Summary:
 - Total Comments: {len(comments_data)}
 - Average Sentiment: {avg_sentiment:.2f}
 - Positive Comments: {positive_count}
 - Negative Comments: {negative_count}
 - Neutral Comments: {len(comments_data) - positive_count - negative_count}
 """
-                        result["comments_analysis"] = comments_summary
-                except Exception as e:
-                    logger.warning(f"Enhanced comments analysis failed: {e}")
-                    result["comments_analysis"] = f"Comments analysis failed: {e}"
-            else:
-                result["comments_analysis"] = "No comments found or analysis failed"
-                
-        except Exception as e:
-            logger.warning("Comment analysis failed: %s", e)
-            result["comments_analysis"] = f"Comment analysis failed: {e}"
+                return comments_data, comments_summary
+            except Exception as e:
+                logger.warning(f"Enhanced comments analysis failed: {e}")
+                return comments_data, f"Comments analysis failed: {e}"
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            # --------------------------------------------------------------
+            # 4. Comments → fetch + sentiment (same as channel analytics)
+            # --------------------------------------------------------------
+            f_comments = pool.submit(_analyse_comments)
+
+            # --------------------------------------------------------------
+            # 1. Download video (respect auto quality based on duration)
+            # --------------------------------------------------------------
+            url = f"https://www.youtube.com/watch?v={video_id}"
+            duration_minutes = get_video_duration_from_url(url)
+            quality = auto_select_video_quality(duration_minutes)
+            video_path = download_video(url, output_dir=output_base, quality=quality)
+
+            # --------------------------------------------------------------
+            # 2. Enhanced Audio Analysis (same as channel analytics)
+            # 3. Video frames → vision analysis (same as channel analytics)
+            # --------------------------------------------------------------
+            f_audio = pool.submit(_analyse_audio, video_path)
+            f_frames = pool.submit(_analyse_frames, video_path)
+
+            audio_analysis, full_transcript = f_audio.result()
+            frames, vision_analysis = f_frames.result()
+            comments_data, result["comments_analysis"] = f_comments.result()
+
+        result["audio_analysis"] = audio_analysis
+        result["video_analysis"] = vision_analysis
 
         # ------------------------------------------------------------------
         # 5. Statistics (Public + OAuth if available)
@@ -333,8 +348,6 @@ def analyze_video(
         # ------------------------------------------------------------------
         try:
             if SETTINGS.openrouter_api_keys or SETTINGS.groq_api_keys or SETTINGS.gemini_api_keys:
-                client = get_smart_client()
-                
                 summary_prompt = get_comprehensive_video_summary_prompt(
                     video_title,
                     audio_analysis,
@@ -344,7 +357,7 @@ def analyze_video(
                     oauth_analytics
                 )
 
-                summary = client.chat(
+                summary = cached_chat(
                     [{"role": "user", "content": summary_prompt}],
                     temperature=0.3,
                     max_tokens=3000,
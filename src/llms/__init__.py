@@ -3,6 +3,7 @@ from .openrouter import OpenRouterClient  # noqa: F401
 from .groq import GroqClient  # noqa: F401
 from .gemini import GeminiClient  # noqa: F401
 from .smart_client import SmartLLMClient  # noqa: F401
+from .cache import cached_chat, cache_get, cache_put  # noqa: F401
 
 __all__ = [
     "LLMClient",
@@ -12,4 +13,7 @@ __all__ = [
     "SmartLLMClient",
     "get_client",
     "get_smart_client",
+    "cached_chat",
+    "cache_get",
+    "cache_put",
 ] 
\ No newline at end of file
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 
 class LLMClient(ABC):
@@ -21,6 +22,19 @@ class LLMClient(ABC):
 # Factory helper
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=32)
+def openai_client(api_key: str, base_url: str, headers: Tuple[Tuple[str, str], ...] = ()):
+    """Return a shared ``OpenAI`` SDK client for *api_key* at *base_url*.
+
+    The key manager builds a provider wrapper per request; sharing the SDK
+    client keeps its HTTP connection pool (and TLS sessions) alive between
+    calls instead of handshaking with the provider every time.
+    """
+    from openai import OpenAI  # local import to avoid heavy deps
+
+    return OpenAI(api_key=api_key, base_url=base_url, default_headers=dict(headers) or None)
+
+
 def get_client(provider: str, api_key: str | None = None) -> "LLMClient":
     """Return an LLMClient for *provider* ('openrouter', 'groq', or 'gemini')."""
 
@@ -0,0 +1,81 @@
+"""On-disk cache for LLM chat responses.
+
+Analysis prompts are deterministic for a given video, so re-running a
+report (or analysing a video that appears in several channels) would
+otherwise pay for the same completions again. Responses are stored as one
+small JSON file per request under ``data/cache/llm``; writes go through a
+temporary file and ``os.replace`` so concurrent threads and processes never
+read a partial entry. :func:`cache_get` and :func:`cache_put` expose the same
+entry format to callers that key requests themselves (e.g. vision frames).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .base import get_smart_client
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "cache" / "llm"
+# Entries expire so stale judgements get refreshed eventually.
+CACHE_TTL_SEC = 7 * 24 * 3600
+
+
+def _cache_path(messages: List[Dict[str, Any]], kwargs: Dict[str, Any]) -> Path:
+    payload = json.dumps([messages, kwargs], sort_keys=True, ensure_ascii=False)
+    return CACHE_DIR / f"{hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()}.json"
+
+
+def cache_get(cache_path: Path) -> Optional[str]:
+    """Return the unexpired response stored at *cache_path*, or ``None``."""
+    try:
+        entry = json.loads(cache_path.read_bytes())
+        if entry.get("expires_at", 0) > time.time():
+            return entry["response"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return None
+
+
+def cache_put(cache_path: Path, response: str) -> None:
+    """Store *response* at *cache_path* for :data:`CACHE_TTL_SEC` seconds."""
+    now = time.time()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(
+            json.dumps({"created_at": now, "expires_at": now + CACHE_TTL_SEC, "response": response}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to cache LLM response: {e}")
+
+
+def cached_chat(messages: List[Dict[str, Any]], **kwargs: Any) -> str:
+    """``get_smart_client().chat`` with responses cached under :data:`CACHE_DIR`.
+
+    The key covers the messages and generation options, so any prompt
+    change misses the cache. Entries expire after :data:`CACHE_TTL_SEC`.
+    The client is only created on a miss; empty replies are not cached.
+    """
+    cache_path = _cache_path(messages, kwargs)
+    cached = cache_get(cache_path)
+    if cached is not None:
+        return cached
+
+    response = get_smart_client().chat(messages, **kwargs)
+    if response:
+        cache_put(cache_path, response)
+    return response
+
+
+__all__ = ["cached_chat", "cache_get", "cache_put", "CACHE_DIR", "CACHE_TTL_SEC"]
@@ -2,9 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from openai import OpenAI
-
-from .base import LLMClient
+from .base import LLMClient, openai_client
 from src.config.settings import SETTINGS
 
 
@@ -16,7 +14,7 @@ class GroqClient(LLMClient):
     def __init__(self, api_key: str | None):
         if not api_key:
             raise ValueError("Groq API key must be provided.")
-        self._client = OpenAI(api_key=api_key, base_url=self.BASE_URL)
+        self._client = openai_client(api_key, self.BASE_URL)
 
     def chat(self, messages: Any, model: str | None = None, **kwargs: Any) -> str:  # type: ignore[override]
         # The OpenAI SDK type hints expect a specific message schema; we bypass strict
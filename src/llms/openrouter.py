@@ -2,9 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from openai import OpenAI
-
-from .base import LLMClient
+from .base import LLMClient, openai_client
 from src.config.settings import SETTINGS
 
 
@@ -18,14 +16,14 @@ class OpenRouterClient(LLMClient):
             raise ValueError("OpenRouter API key must be provided.")
 
         # The OpenAI Python library v1.0+ supports custom hosts via *base_url*.
-        # We initialise a dedicated client instance to avoid global side-effects.
-        self._client = OpenAI(
-            api_key=api_key,
-            base_url=self.BASE_URL,
-            default_headers={
-                "HTTP-Referer": "https://github.com/prince/NC_IM",  # project attribution per provider policy
-                "X-Title": "NC_IM Video Analyzer",
-            },
+        # Clients are shared per key so the connection pool survives between calls.
+        self._client = openai_client(
+            api_key,
+            self.BASE_URL,
+            (
+                ("HTTP-Referer", "https://github.com/prince/NC_IM"),  # project attribution per provider policy
+                ("X-Title", "NC_IM Video Analyzer"),
+            ),
         )
 
     # ---------------------------------------------------------------------
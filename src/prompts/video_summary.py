@@ -1,5 +1,8 @@
 """Video summary prompts for comprehensive analysis compilation."""
 
+import io
+
+
 def get_comprehensive_video_summary_prompt(
     video_title: str,
     audio_analysis: str,
@@ -130,12 +133,40 @@ VERIFICATION REQUIREMENTS:
 - Always state the data source for OAuth vs. public statistics when making comparisons"""
 
 
+def get_video_stats_context(stats: dict, oauth_analytics: dict = None) -> str:
+    """Condense a video's statistics and OAuth analytics for chat context.
+
+    The raw API responses carry thumbnails, localisations and full report
+    tables; the model only needs the headline numbers, so this renders the
+    same figures the summary prompt uses instead of the JSON dumps.
+
+    Args:
+        stats: Video resource as returned by ``videos().list``
+        oauth_analytics: OAuth analytics data (if available)
+
+    Returns:
+        Plain-text block of statistics
+    """
+    stats_dict = stats or {}
+    statistics = stats_dict.get('statistics', {})
+    snippet = stats_dict.get('snippet', {})
+
+    context = f"""- Views: {statistics.get('viewCount', 'N/A')}
+- Likes: {statistics.get('likeCount', 'N/A')}
+- Comments: {statistics.get('commentCount', 'N/A')}
+- Duration: {stats_dict.get('contentDetails', {}).get('duration', 'N/A')}
+- Published: {snippet.get('publishedAt', 'N/A')}
+"""
+    return context + (_format_oauth_analytics(oauth_analytics) if oauth_analytics else "")
+
+
 def _format_oauth_analytics(oauth_analytics: dict) -> str:
     """Format OAuth analytics data for inclusion in the video summary prompt."""
     if not oauth_analytics or isinstance(oauth_analytics, dict) and oauth_analytics.get("error"):
         return ""
     
-    oauth_section = "ENHANCED ANALYTICS (OAuth Enabled):\n"
+    buf = io.StringIO()
+    buf.write("ENHANCED ANALYTICS (OAuth Enabled):\n")
     
     # Summary metrics (views, watch time, likes, comments from Analytics API)
     summary_metrics = oauth_analytics.get("summary_metrics", {})
@@ -149,15 +180,15 @@ def _format_oauth_analytics(oauth_analytics: dict) -> str:
         total_watch_time = int(row[2]) if len(row) > 2 else 0
         avg_duration = int(row[3]) if len(row) > 3 else 0
         
-        oauth_section += f"- Analytics Views: {total_views:,}\n"
-        oauth_section += f"- Total Watch Time: {total_watch_time:,} minutes ({total_watch_time/60:.1f} hours)\n"
-        oauth_section += f"- Average View Duration: {avg_duration:,} seconds ({avg_duration/60:.1f} minutes)\n"
-        oauth_section += f"- Analytics Likes: {int(row[4]) if len(row) > 4 else 'N/A':,}\n"
-        oauth_section += f"- Analytics Comments: {int(row[5]) if len(row) > 5 else 'N/A':,}\n"
+        buf.write(f"- Analytics Views: {total_views:,}\n")
+        buf.write(f"- Total Watch Time: {total_watch_time:,} minutes ({total_watch_time/60:.1f} hours)\n")
+        buf.write(f"- Average View Duration: {avg_duration:,} seconds ({avg_duration/60:.1f} minutes)\n")
+        buf.write(f"- Analytics Likes: {int(row[4]) if len(row) > 4 else 'N/A':,}\n")
+        buf.write(f"- Analytics Comments: {int(row[5]) if len(row) > 5 else 'N/A':,}\n")
         
         # Calculate view duration percentage (if we can estimate video length)
         if avg_duration > 0:
-            oauth_section += f"- Average View Duration Ratio: {(avg_duration/300)*100:.1f}% (assuming 5min video)\n"
+            buf.write(f"- Average View Duration Ratio: {(avg_duration/300)*100:.1f}% (assuming 5min video)\n")
     
     # Engagement metrics with calculated rates
     engagement_metrics = oauth_analytics.get("engagement_metrics", {})
@@ -171,10 +202,10 @@ def _format_oauth_analytics(oauth_analytics: dict) -> str:
         playlist_adds = int(eng_row[7]) if len(eng_row) > 7 else 0
         saves = int(eng_row[8]) if len(eng_row) > 8 else 0
         
-        oauth_section += f"- Shares: {eng_shares:,}\n"
-        oauth_section += f"- Subscribers Gained: {subs_gained:,}\n"
-        oauth_section += f"- Playlist Adds: {playlist_adds:,}\n"
-        oauth_section += f"- Saves: {saves:,}\n"
+        buf.write(f"- Shares: {eng_shares:,}\n")
+        buf.write(f"- Subscribers Gained: {subs_gained:,}\n")
+        buf.write(f"- Playlist Adds: {playlist_adds:,}\n")
+        buf.write(f"- Saves: {saves:,}\n")
         
         # Calculate engagement rates
         if eng_views > 0:
@@ -184,11 +215,11 @@ def _format_oauth_analytics(oauth_analytics: dict) -> str:
             share_rate = (eng_shares / eng_views) * 100
             sub_conversion_rate = (subs_gained / eng_views) * 100
             
-            oauth_section += f"- Overall Engagement Rate: {engagement_rate:.2f}%\n"
-            oauth_section += f"- Like Rate: {like_rate:.2f}%\n"
-            oauth_section += f"- Comment Rate: {comment_rate:.2f}%\n"
-            oauth_section += f"- Share Rate: {share_rate:.2f}%\n"
-            oauth_section += f"- Subscriber Conversion Rate: {sub_conversion_rate:.3f}%\n"
+            buf.write(f"- Overall Engagement Rate: {engagement_rate:.2f}%\n")
+            buf.write(f"- Like Rate: {like_rate:.2f}%\n")
+            buf.write(f"- Comment Rate: {comment_rate:.2f}%\n")
+            buf.write(f"- Share Rate: {share_rate:.2f}%\n")
+            buf.write(f"- Subscriber Conversion Rate: {sub_conversion_rate:.3f}%\n")
     
     # Impressions and CTR with calculated ratios
     impressions_data = oauth_analytics.get("impressions", {})
@@ -198,23 +229,23 @@ def _format_oauth_analytics(oauth_analytics: dict) -> str:
         ctr = float(imp_row[1]) if len(imp_row) > 1 else 0
         unique_viewers = int(imp_row[2]) if len(imp_row) > 2 else 0
         
-        oauth_section += f"- Impressions: {impressions:,}\n"
-        oauth_section += f"- Click-through Rate: {ctr:.2f}%\n"
-        oauth_section += f"- Unique Viewers: {unique_viewers:,}\n"
+        buf.write(f"- Impressions: {impressions:,}\n")
+        buf.write(f"- Click-through Rate: {ctr:.2f}%\n")
+        buf.write(f"- Unique Viewers: {unique_viewers:,}\n")
         
         # Calculate view-to-impression ratio and unique viewer rate
         if impressions > 0 and total_views > 0:
             views_per_impression = (total_views / impressions) * 100
-            oauth_section += f"- Views per Impression: {views_per_impression:.1f}%\n"
+            buf.write(f"- Views per Impression: {views_per_impression:.1f}%\n")
         
         if total_views > 0 and unique_viewers > 0:
             repeat_view_rate = ((total_views - unique_viewers) / total_views) * 100
-            oauth_section += f"- Repeat View Rate: {repeat_view_rate:.1f}%\n"
+            buf.write(f"- Repeat View Rate: {repeat_view_rate:.1f}%\n")
     
     # Traffic sources (top 3) with percentages
     traffic_sources = oauth_analytics.get("traffic_sources", [])
     if traffic_sources and not isinstance(traffic_sources, dict):
-        oauth_section += "- Top Traffic Sources:\n"
+        buf.write("- Top Traffic Sources:\n")
         source_names = {
             'PLAYLIST': 'Playlists',
             'SEARCH': 'YouTube Search', 
@@ -234,12 +265,12 @@ def _format_oauth_analytics(oauth_analytics: dict) -> str:
                 source = source_names.get(row[0], row[0])
                 views = int(row[1])
                 percentage = (views / total_traffic_views * 100) if total_traffic_views > 0 else 0
-                oauth_section += f"  {i+1}. {source}: {views:,} views ({percentage:.1f}%)\n"
+                buf.write(f"  {i+1}. {source}: {views:,} views ({percentage:.1f}%)\n")
     
     # Geographic data (top 3 countries) with percentages
     geography_data = oauth_analytics.get("geography", [])
     if geography_data and not isinstance(geography_data, dict):
-        oauth_section += "- Top Geographic Regions:\n"
+        buf.write("- Top Geographic Regions:\n")
         country_names = {
             'US': 'United States', 'GB': 'United Kingdom', 'CA': 'Canada',
             'AU': 'Australia', 'DE': 'Germany', 'FR': 'France', 'IN': 'India',
@@ -255,7 +286,7 @@ def _format_oauth_analytics(oauth_analytics: dict) -> str:
                 country = country_names.get(row[0], row[0])
                 views = int(row[1])
                 percentage = (views / total_geo_views * 100) if total_geo_views > 0 else 0
-                oauth_section += f"  {i+1}. {country}: {views:,} views ({percentage:.1f}%)\n"
+                buf.write(f"  {i+1}. {country}: {views:,} views ({percentage:.1f}%)\n")
     
     # Audience retention insights
     retention_data = oauth_analytics.get("audience_retention", [])
@@ -265,20 +296,20 @@ def _format_oauth_analytics(oauth_analytics: dict) -> str:
             avg_retention = sum(retention_rates) / len(retention_rates)
             max_retention = max(retention_rates)
             min_retention = min(retention_rates)
-            oauth_section += f"- Average Audience Retention: {avg_retention:.1f}%\n"
-            oauth_section += f"- Peak Retention: {max_retention:.1f}%\n"
-            oauth_section += f"- Lowest Retention: {min_retention:.1f}%\n"
+            buf.write(f"- Average Audience Retention: {avg_retention:.1f}%\n")
+            buf.write(f"- Peak Retention: {max_retention:.1f}%\n")
+            buf.write(f"- Lowest Retention: {min_retention:.1f}%\n")
     
     # Demographics (top age/gender groups)
     demographics_data = oauth_analytics.get("demographics", [])
     if demographics_data and not isinstance(demographics_data, dict):
-        oauth_section += "- Top Demographics:\n"
+        buf.write("- Top Demographics:\n")
         for i, row in enumerate(demographics_data[:3]):
             if len(row) >= 3:
                 age_group = row[0]
                 gender = row[1]
                 percentage = float(row[2])
-                oauth_section += f"  {i+1}. {age_group} {gender}: {percentage:.1f}%\n"
+                buf.write(f"  {i+1}. {age_group} {gender}: {percentage:.1f}%\n")
     
     # Monetization (if available) with calculated rates
     monetization_data = oauth_analytics.get("monetization", {})
@@ -287,23 +318,23 @@ def _format_oauth_analytics(oauth_analytics: dict) -> str:
         estimated_revenue = float(mon_row[0]) if len(mon_row) > 0 else 0
         ad_revenue = float(mon_row[1]) if len(mon_row) > 1 else 0
         if estimated_revenue > 0:
-            oauth_section += f"- Estimated Revenue: ${estimated_revenue:.2f}\n"
-            oauth_section += f"- Ad Revenue: ${ad_revenue:.2f}\n"
+            buf.write(f"- Estimated Revenue: ${estimated_revenue:.2f}\n")
+            buf.write(f"- Ad Revenue: ${ad_revenue:.2f}\n")
             
             cpm = float(mon_row[4]) if len(mon_row) > 4 else 0
-            oauth_section += f"- CPM: ${cpm:.2f}\n"
+            buf.write(f"- CPM: ${cpm:.2f}\n")
             
             # Calculate RPM (Revenue per 1000 views)
             if total_views > 0:
                 rpm = (estimated_revenue / total_views) * 1000
-                oauth_section += f"- RPM (Revenue per 1000 views): ${rpm:.2f}\n"
+                buf.write(f"- RPM (Revenue per 1000 views): ${rpm:.2f}\n")
                 
             # Calculate revenue per watch hour
             if total_watch_time > 0:
                 revenue_per_hour = (estimated_revenue / (total_watch_time / 60))
-                oauth_section += f"- Revenue per Watch Hour: ${revenue_per_hour:.2f}\n"
+                buf.write(f"- Revenue per Watch Hour: ${revenue_per_hour:.2f}\n")
     
-    return oauth_section
+    return buf.getvalue()
 
 
 def get_channel_collective_analysis_prompt(
@@ -58,8 +58,7 @@ def render_onboarding() -> None:
             with col_batch1:
                 if st.button("🔄 Refresh All", help="Refresh all expired tokens"):
                     refreshed = 0
-                    for tf in token_files:
-                        details = hc.get_creator_details(tf)
+                    for details in hc.get_all_creator_details(token_files):
                         if not details["is_valid"] and hc.refresh_creator_token(
                             details["channel_id"]
                         ):
@@ -81,7 +80,7 @@ def render_onboarding() -> None:
                             "is_valid": det["is_valid"],
                             "last_checked": det["last_checked"],
                         }
-                        for det in (hc.get_creator_details(tf) for tf in token_files)
+                        for det in hc.get_all_creator_details(token_files)
                     ]
                     st.download_button(
                         "💾 Download creators.json",
@@ -92,8 +91,7 @@ def render_onboarding() -> None:
 
             st.divider()
 
-            for tf in token_files:
-                details = hc.get_creator_details(tf)
+            for details in hc.get_all_creator_details(token_files):
 
                 status_color = "🟢" if details["is_valid"] else "🔴"
                 status_text = "Active" if details["is_valid"] else "Invalid/Expired"
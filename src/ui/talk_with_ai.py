@@ -8,7 +8,9 @@ from datetime import datetime
 from typing import List, Dict, Any
 
 from src.llms import get_smart_client
+from src.prompts.video_summary import get_video_stats_context
 from src.config.settings import SETTINGS
+from src.helpers.json_io import read_json as _read_json
 
 
 def _initialize_chat_session():
@@ -35,7 +37,7 @@ def _get_available_analyses() -> List[Dict[str, Any]]:
                 
                 if analysis_file.exists():
                     try:
-                        analysis_data = json.loads(analysis_file.read_text())
+                        analysis_data = _read_json(analysis_file)
                         analyses.append({
                             "type": "video",
                             "id": video_dir.name,
@@ -110,7 +112,7 @@ def _get_available_analyses() -> List[Dict[str, Any]]:
                         stats_file = first_video_dir / f"{first_video_dir.name}_stats.json"
                         if stats_file.exists():
                             try:
-                                stats_data = json.loads(stats_file.read_text())
+                                stats_data = _read_json(stats_file)
                                 snippet = stats_data.get('snippet', {})
                                 channel_title = snippet.get('channelTitle', f'Channel {channel_dir.name[:8]}...')
                             except Exception:
@@ -121,7 +123,7 @@ def _get_available_analyses() -> List[Dict[str, Any]]:
                             data_file = video_dir / f"{video_dir.name}_data.json"
                             if data_file.exists():
                                 try:
-                                    video_data = json.loads(data_file.read_text())
+                                    video_data = _read_json(data_file)
                                     duration = video_data.get('duration_minutes', 0)
                                     total_duration += duration
                                 except Exception:
@@ -161,8 +163,9 @@ Analysis Data:
 - Audio Analysis: {analysis['data'].get('audio_analysis', 'Not available')}
 - Video Analysis: {analysis['data'].get('video_analysis', 'Not available')}
 - Comments Analysis: {analysis['data'].get('comments_analysis', 'Not available')}
-- Statistics: {json.dumps(analysis['data'].get('statistics', {}), indent=2)}
-- OAuth Analytics: {json.dumps(analysis['data'].get('oauth_analytics', {}), indent=2) if analysis['data'].get('oauth_analytics') else 'Not available'}
+
+Statistics:
+{get_video_stats_context(analysis['data'].get('statistics', {}), analysis['data'].get('oauth_analytics'))}
 
 Frames Count: {analysis['data'].get('frames_count', 0)}
 Comments Count: {analysis['data'].get('comments_count', 0)}
@@ -205,7 +208,7 @@ Channel Overview:
                 data_file = video_dir / f"{video_id}_data.json"
                 if data_file.exists():
                     try:
-                        video_data = json.loads(data_file.read_text())
+                        video_data = _read_json(data_file)
                         context += f"Title: {video_data.get('title', 'N/A')}\n"
                         context += f"Duration: {video_data.get('duration_minutes', 'N/A')} minutes\n"
                         context += f"URL: {video_data.get('url', 'N/A')}\n"
@@ -231,7 +234,7 @@ Channel Overview:
                 stats_file = video_dir / f"{video_id}_stats.json"
                 if stats_file.exists():
                     try:
-                        stats_data = json.loads(stats_file.read_text())
+                        stats_data = _read_json(stats_file)
                         snippet = stats_data.get('snippet', {})
                         statistics = stats_data.get('statistics', {})
                         
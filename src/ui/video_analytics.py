@@ -4,9 +4,11 @@ from __future__ import annotations
 import streamlit as st
 import json
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 
 from src.helpers import video_analytics as va
+from src.helpers.json_io import read_json
 from src.analysis.video_frames import parse_iso_duration_to_minutes, extract_video_id
 
 
@@ -20,12 +22,19 @@ def _safe_read_file(file_path: Path, encoding: str = "utf-8") -> str:
         return ""
 
 
+@lru_cache(maxsize=64)
+def _load_json(file_path: Path, mtime_ns: int):
+    """Parse *file_path*; cached per modification time across Streamlit reruns."""
+    return read_json(file_path)
+
+
 def _safe_read_json(file_path: Path) -> dict:
-    """Safely read JSON file, return empty dict if file doesn't exist."""
+    """Safely read JSON file, return empty dict if file doesn't exist.
+
+    The parsed data is shared between reruns, so callers must not mutate it.
+    """
     try:
-        if file_path.exists():
-            return json.loads(file_path.read_text(encoding="utf-8"))
-        return {}
+        return _load_json(file_path, file_path.stat().st_mtime_ns)
     except Exception:
         return {}
 
@@ -7,22 +7,35 @@ build a youtubeAnalytics v2 client.
 
 from __future__ import annotations
 
+import weakref
 from datetime import date, timedelta
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any
 
-from googleapiclient.discovery import build  # type: ignore
-from googleapiclient.discovery import Resource  # type: ignore
+if TYPE_CHECKING:  # pragma: no cover - annotations only; imported lazily at runtime
+    from googleapiclient.discovery import Resource  # type: ignore
 
 
 # ---------------------------------------------------------------------------
 # Internal helper
 # ---------------------------------------------------------------------------
 
+# Analytics services per Data API service; data services are per thread, so
+# the analytics transport stays on the same thread as well.
+_ANALYTICS_SERVICES: "weakref.WeakKeyDictionary[Resource, Resource]" = weakref.WeakKeyDictionary()
+
+
 def _get_analytics_service(data_service: Resource):
     """Build and cache a youtubeAnalytics service from the same credentials."""
 
-    creds = data_service._http.credentials  # type: ignore[attr-defined]
-    return build("youtubeAnalytics", "v2", credentials=creds)
+    service = _ANALYTICS_SERVICES.get(data_service)
+    if service is None:
+        from googleapiclient.discovery import build  # type: ignore
+
+        creds = data_service._http.credentials  # type: ignore[attr-defined]
+        service = _ANALYTICS_SERVICES[data_service] = build(
+            "youtubeAnalytics", "v2", credentials=creds, static_discovery=True, cache_discovery=False
+        )
+    return service
 
 
 # ---------------------------------------------------------------------------
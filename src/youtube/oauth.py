@@ -8,9 +8,10 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+from functools import lru_cache
 from pathlib import Path
-from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
-from googleapiclient.discovery import build  # type: ignore
+import json
+import threading
 from google.oauth2.credentials import Credentials  # type: ignore
 from google.auth.transport.requests import Request  # type: ignore
 import sys
@@ -29,15 +30,39 @@ __all__ = [
     "get_public_service",
 ]
 
+# Built services per thread, keyed by credential files, scopes and the token
+# file's mtime so a refreshed or re-onboarded token gets a fresh service.
+# httplib2 transports must not be shared between threads.
+_SERVICES = threading.local()
+
+
+def _service_key(client_secrets_file: Path, token_file: Path, scopes: list[str] | None):
+    try:
+        mtime_ns = token_file.stat().st_mtime_ns
+    except OSError:
+        return None
+    return str(client_secrets_file), str(token_file), tuple(scopes or SCOPES), mtime_ns
+
+
+@lru_cache(maxsize=64)
+def _read_token_info(token_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse *token_path*; *mtime_ns* keys the cache so rewritten tokens are re-read."""
+    with open(token_path, encoding="utf-8") as fh:
+        return json.load(fh)
+
 
 def _load_credentials(token_file: Path):
-    if token_file.exists():
-        creds = Credentials.from_authorized_user_file(str(token_file), SCOPES)
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())  # type: ignore
-            token_file.write_text(creds.to_json())
-        return creds
-    return None
+    try:
+        mtime_ns = token_file.stat().st_mtime_ns
+    except OSError:
+        return None
+    # Only the parsed JSON is shared; each caller gets its own Credentials so a
+    # refresh in one thread never mutates another thread's object
+    creds = Credentials.from_authorized_user_info(_read_token_info(str(token_file), mtime_ns), SCOPES)
+    if creds and creds.expired and creds.refresh_token:
+        creds.refresh(Request())  # type: ignore
+        token_file.write_text(creds.to_json())
+    return creds
 
 
 def get_service(client_secrets_file: Path | str, token_file: Path | str, *, scopes: list[str] | None = None, **_ignored):  # type: ignore[override]
@@ -46,12 +71,19 @@ def get_service(client_secrets_file: Path | str, token_file: Path | str, *, scop
     client_secrets_file = Path(client_secrets_file)
     token_file = Path(token_file)
 
+    services = _SERVICES.__dict__.setdefault("by_key", {})
+    key = _service_key(client_secrets_file, token_file, scopes)
+    if key in services:
+        return services[key]
+
     creds = _load_credentials(token_file)
 
     # ------------------------------------------------------------------
     # Perform OAuth flow if no valid credentials are cached
     # ------------------------------------------------------------------
     if not creds:
+        from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore  # only needed to onboard
+
         use_scopes = scopes or SCOPES
         flow = InstalledAppFlow.from_client_secrets_file(
             str(client_secrets_file), use_scopes
@@ -107,4 +139,13 @@ def get_service(client_secrets_file: Path | str, token_file: Path | str, *, scop
         # Persist newly obtained credentials for future sessions
         token_file.write_text(creds.to_json())
 
-    return build("youtube", "v3", credentials=creds) 
\ No newline at end of file
+    # Imported on first use (heavy); bundled discovery document, no legacy
+    # discovery cache (see public.py)
+    from googleapiclient.discovery import build  # type: ignore
+
+    service = build("youtube", "v3", credentials=creds, static_discovery=True, cache_discovery=False)
+    # Key again: loading may have refreshed and rewritten the token file
+    key = _service_key(client_secrets_file, token_file, scopes)
+    if key is not None:
+        services[key] = service
+    return service 
\ No newline at end of file
@@ -6,16 +6,35 @@ No authentication required – works with API key only.
 from __future__ import annotations
 
 import re
+import threading
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import isodate
 
-from googleapiclient.discovery import build  # type: ignore
+# Built services per thread: building parses the discovery document, and the
+# httplib2 transport inside a service must not be shared between threads.
+# Services are built from the discovery document bundled with
+# google-api-python-client; the legacy discovery cache only probes for
+# oauth2client and logs a warning on every build, so it is skipped.
+_SERVICES = threading.local()
 
 
 def get_service(api_key: str):
-    """Build YouTube Data API v3 service with API key."""
-    return build("youtube", "v3", developerKey=api_key)
+    """Build YouTube Data API v3 service with API key.
+
+    The service is reused for later calls with the same key on this thread,
+    which also keeps its HTTP connection alive between requests.
+    """
+    services = _SERVICES.__dict__.setdefault("by_key", {})
+    service = services.get(api_key)
+    if service is None:
+        # Imported on first use: googleapiclient pulls in ~250 ms of modules
+        from googleapiclient.discovery import build  # type: ignore
+
+        service = services[api_key] = build(
+            "youtube", "v3", developerKey=api_key, static_discovery=True, cache_discovery=False
+        )
+    return service
 
 
 def extract_channel_id_from_url(url: str) -> Optional[str]: